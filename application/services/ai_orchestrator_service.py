@@ -1,11 +1,13 @@
 """AI Orchestrator Service for Unified Context Layer"""
-from typing import List, Dict, Any, Optional, Set
-from datetime import datetime, timedelta
+from typing import Deque, List, Dict, Any, Optional, Set
+from datetime import datetime, timedelta, timezone
+from collections import deque
 import asyncio
 import json
 from dataclasses import asdict
 
 from domain.entities.project_context import AISession, ContextResponse
+from domain.exceptions import UCLNotFoundError, UCLValidationError
 from application.ports.ai_adapter_port import (
     AIAdapterPort,
     AIContextRequest,
@@ -16,6 +18,10 @@ from application.ports.context_repository import AISessionRepositoryPort
 from application.services.context_service import ContextService
 
 
+# Failed AI context updates kept for inspection, oldest dropped first
+FAILED_UPDATES_LIMIT = 1000
+
+
 class AIOrchestrator:
     """Service for orchestrating multiple AI interactions with UCL"""
 
@@ -31,10 +37,37 @@ class AIOrchestrator:
         self._registered_ais: Dict[str, AICapabilities] = {}
         self._active_subscriptions: Dict[str, Dict[str, Any]] = {}
         self._rate_limiters: Dict[str, Dict[str, Any]] = {}
+        self._failed_updates: Deque[Dict[str, Any]] = deque(maxlen=FAILED_UPDATES_LIMIT)
+        # ai_id per (instance id, capability profile), so an instance re-registering
+        # the same capabilities gets its id back without a new registration
+        self._registration_ids: Dict[tuple, str] = {}
+
+    async def register_ai(
+        self,
+        capabilities: AICapabilities,
+        ai_instance_id: Optional[str] = None,
+        force: bool = False
+    ) -> str:
+        """Register AI with orchestrator, reusing the id of a known instance"""
+        # Without an instance id there is no identity to remember the registration by
+        key = None
+        if ai_instance_id:
+            key = (
+                ai_instance_id,
+                capabilities.ai_type,
+                capabilities.supports_streaming,
+                capabilities.supports_functions,
+                capabilities.supports_multimodal,
+                capabilities.max_context_length,
+                capabilities.preferred_format,
+                frozenset(capabilities.rate_limits.items())
+            )
+            if not force and key in self._registration_ids:
+                return self._registration_ids[key]
 
-    async def register_ai(self, capabilities: AICapabilities) -> str:
-        """Register AI with orchestrator"""
         ai_id = await self._ai_adapter.register_ai(capabilities)
+        if key is not None:
+            self._registration_ids[key] = ai_id
         self._registered_ais[ai_id] = capabilities
 
         # Initialize rate limiter for this AI
@@ -53,7 +86,7 @@ class AIOrchestrator:
         """Handle context request from AI"""
         # Check rate limits
         if not await self._check_rate_limit(request.ai_instance_id):
-            raise ValueError(f"Rate limit exceeded for AI {request.ai_instance_id}")
+            raise UCLValidationError(f"Rate limit exceeded for AI {request.ai_instance_id}")
 
         # Get or create AI session
         session = await self._get_or_create_session(request, project_id)
@@ -92,12 +125,34 @@ class AIOrchestrator:
         project_id: str
     ) -> bool:
         """Handle context update from AI"""
-        # Validate session
+        session = await self.validate_ai_context_update(update, project_id)
+        return await self.apply_ai_context_update(update, project_id, session)
+
+    async def validate_ai_context_update(
+        self,
+        update: AIContextUpdate,
+        project_id: str
+    ) -> AISession:
+        """Check rate limit, session and project before an update is accepted"""
+        if not await self._check_rate_limit(update.ai_instance_id):
+            raise UCLValidationError(f"Rate limit exceeded for AI {update.ai_instance_id}")
+
         session = await self._session_repo.get_ai_session(update.session_id)
         if not session or session.ai_type != update.ai_type:
-            raise ValueError("Invalid session or AI type mismatch")
+            raise UCLValidationError("Invalid session or AI type mismatch")
 
-        # Process updates
+        if not await self._context_service.project_exists(project_id):
+            raise UCLNotFoundError(f"Project {project_id} not found")
+
+        return session
+
+    async def apply_ai_context_update(
+        self,
+        update: AIContextUpdate,
+        project_id: str,
+        session: AISession
+    ) -> bool:
+        """Apply a validated context update, recording the items that fail"""
         success = True
         for update_item in update.updates:
             try:
@@ -105,7 +160,7 @@ class AIOrchestrator:
                     project_id, update.domain_type, update_item, session.id
                 )
             except Exception as e:
-                print(f"Error processing update: {e}")
+                self.record_failed_update(update, project_id, str(e), [update_item])
                 success = False
 
         # Notify subscribed AIs about changes
@@ -116,6 +171,28 @@ class AIOrchestrator:
 
         return success
 
+    def record_failed_update(
+        self,
+        update: AIContextUpdate,
+        project_id: str,
+        error: str,
+        items: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Keep a failed update (or some of its items) for later inspection"""
+        self._failed_updates.append({
+            "project_id": project_id,
+            "ai_instance_id": update.ai_instance_id,
+            "session_id": update.session_id,
+            "domain_type": update.domain_type,
+            "updates": update.updates if items is None else items,
+            "error": error,
+            "failed_at": datetime.now(timezone.utc),
+        })
+
+    def get_failed_updates(self, project_id: str) -> List[Dict[str, Any]]:
+        """Failed context updates recorded for a project, oldest first"""
+        return [entry for entry in self._failed_updates if entry["project_id"] == project_id]
+
     async def subscribe_ai_to_updates(
         self,
         ai_instance_id: str,
@@ -280,7 +280,7 @@ class ContextCacheService:
             return data
 
         except Exception as e:
-            logger.error(f"Error getting cached entry {key}: {e}")
+            logger.error("Error getting cached entry %s: %s", key, e)
             return None
 
     async def _set_with_version(
@@ -325,7 +325,7 @@ class ContextCacheService:
             return True
 
         except Exception as e:
-            logger.error(f"Error setting cached entry {key}: {e}")
+            logger.error("Error setting cached entry %s: %s", key, e)
             return False
 
     async def _set_with_dependencies(
@@ -350,7 +350,7 @@ class ContextCacheService:
             return None
 
         except Exception as e:
-            logger.error(f"Error getting simple cached entry {key}: {e}")
+            logger.error("Error getting simple cached entry %s: %s", key, e)
             return None
 
     async def _set_simple(self, key: str, data: Dict[str, Any], ttl: int) -> bool:
@@ -364,7 +364,7 @@ class ContextCacheService:
             return True
 
         except Exception as e:
-            logger.error(f"Error setting simple cached entry {key}: {e}")
+            logger.error("Error setting simple cached entry %s: %s", key, e)
             return False
 
     async def _invalidate_dependents(self, key: str):
@@ -393,7 +393,7 @@ class ContextCacheService:
             await self._redis.delete(dependents_key)
 
         except Exception as e:
-            logger.error(f"Error invalidating dependents of {key}: {e}")
+            logger.error("Error invalidating dependents of %s: %s", key, e)
 
     async def _invalidate_with_dependents(self, key: str):
         """Invalidate key and all its dependents"""
@@ -423,7 +423,7 @@ class ContextCacheService:
                     break
 
         except Exception as e:
-            logger.error(f"Error invalidating pattern {pattern}: {e}")
+            logger.error("Error invalidating pattern %s: %s", pattern, e)
 
     # Cache statistics and monitoring
 
@@ -458,13 +458,13 @@ class ContextCacheService:
             return stats
 
         except Exception as e:
-            logger.error(f"Error getting cache stats: {e}")
+            logger.error("Error getting cache stats: %s", e)
             return {}
 
     async def warm_cache(self, project_id: str, platform_types: List[str]):
         """Pre-warm cache with commonly accessed data"""
         # This would be called during startup or after major updates
-        logger.info(f"Warming cache for project {project_id}")
+        logger.info("Warming cache for project %s", project_id)
 
         # Warm global context
         # global_context = await some_service.get_global_context(project_id)
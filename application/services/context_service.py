@@ -1,6 +1,7 @@
 """Context Service for Unified Context Layer"""
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
 import json
 import hashlib
 
@@ -14,6 +15,7 @@ from domain.entities.project_context import (
     GlobalContext,
     PlatformContext
 )
+from domain.exceptions import UCLNotFoundError
 from application.ports.context_repository import (
     ContextRepositoryPort,
     DomainContextRepositoryPort,
@@ -25,6 +27,11 @@ from application.ports.context_repository import (
 from application.ports.ai_adapter_port import VectorStorePort, IndexerPort
 
 
+async def _resolved(value: Any = None) -> Any:
+    """Awaitable placeholder for a source that was not requested"""
+    return value
+
+
 class ContextService:
     """Main service for managing project context"""
 
@@ -82,6 +89,10 @@ class ContextService:
 
         return await self._context_repo.create_project_context(context)
 
+    async def project_exists(self, project_id: str) -> bool:
+        """Check a project exists without loading its domains and sessions"""
+        return await self._context_repo.get_project_context(project_id) is not None
+
     async def get_project_context(self, project_id: str) -> Optional[ProjectContext]:
         """Get project context with all domains and sessions"""
         context = await self._context_repo.get_project_context(project_id)
@@ -231,24 +242,19 @@ class ContextService:
         days: int = 30
     ) -> Dict[str, Any]:
         """Get project analytics"""
-        # Get query statistics
-        popular_queries = await self._query_repo.get_popular_queries(project_id, days)
+        # Query, session, domain and vector store statistics are independent
+        popular_queries, sessions, domains, vector_stats = await asyncio.gather(
+            self._query_repo.get_popular_queries(project_id, days),
+            self._session_repo.get_sessions_by_project(project_id),
+            self._domain_repo.get_domains_by_project(project_id),
+            self._vector_store.get_project_stats(project_id) if self._vector_store else _resolved({})
+        )
 
-        # Get session statistics
-        sessions = await self._session_repo.get_sessions_by_project(project_id)
         recent_sessions = [
             s for s in sessions
             if s.session_start > datetime.utcnow() - timedelta(days=days)
         ]
 
-        # Get domain statistics
-        domains = await self._domain_repo.get_domains_by_project(project_id)
-
-        # Vector store stats if available
-        vector_stats = {}
-        if self._vector_store:
-            vector_stats = await self._vector_store.get_project_stats(project_id)
-
         return {
             "queries": {
                 "popular": popular_queries,
@@ -436,7 +442,7 @@ class ContextService:
         # Get global context
         global_context = await self._global_context_repo.get_global_context_by_project(project_id)
         if not global_context:
-            raise ValueError(f"No global context found for project {project_id}")
+            raise UCLNotFoundError(f"No global context found for project {project_id}")
 
         platform_context = PlatformContext(
             platform_type=platform_type,
@@ -520,31 +526,33 @@ class ContextService:
         """Query context with global and platform hierarchy"""
         start_time = datetime.utcnow()
         results = []
+        include_domains = bool(domains_filter) or not (include_platform or include_global)
 
-        # 1. Get platform context if requested
-        if include_platform:
-            platform_context = await self.get_platform_context(project_id, platform_type)
-            if platform_context:
-                platform_results = self._search_platform_context(
-                    platform_context, query_text, max_results // 3
-                )
-                results.extend(platform_results)
-
-        # 2. Get global context if requested
-        if include_global:
-            global_context = await self.get_global_context(project_id)
-            if global_context:
-                global_results = self._search_global_context(
-                    global_context, query_text, max_results // 3
-                )
-                results.extend(global_results)
-
-        # 3. Get domain contexts (existing functionality)
-        if domains_filter or not (include_platform or include_global):
-            domain_results = await self._search_structured_context(
+        # Load the requested levels concurrently
+        platform_context, global_context, domain_results = await asyncio.gather(
+            self.get_platform_context(project_id, platform_type) if include_platform else _resolved(),
+            self.get_global_context(project_id) if include_global else _resolved(),
+            self._search_structured_context(
                 project_id, query_text, domains_filter, max_results // 3
+            ) if include_domains else _resolved([])
+        )
+
+        # 1. Platform context results
+        if platform_context:
+            platform_results = self._search_platform_context(
+                platform_context, query_text, max_results // 3
             )
-            results.extend(domain_results)
+            results.extend(platform_results)
+
+        # 2. Global context results
+        if global_context:
+            global_results = self._search_global_context(
+                global_context, query_text, max_results // 3
+            )
+            results.extend(global_results)
+
+        # 3. Domain context results (existing functionality)
+        results.extend(domain_results)
 
         # Process and deduplicate results
         processed_results = await self._process_query_results(results, "structured")
@@ -119,7 +119,7 @@ class ContextSyncService:
                 await asyncio.sleep(1)
 
             except Exception as e:
-                logger.error(f"Error in sync loop: {e}")
+                logger.error("Error in sync loop: %s", e)
                 await asyncio.sleep(5)
 
     async def subscribe_to_changes(
@@ -226,7 +226,7 @@ class ContextSyncService:
             change.requires_approval = True
 
         self._pending_changes.append(change)
-        logger.debug(f"Queued change: {change.change_type} for project {change.project_id}")
+        logger.debug("Queued change: %s for project %s", change.change_type, change.project_id)
 
     async def _process_pending_changes(self):
         """Process all pending changes"""
@@ -263,7 +263,7 @@ class ContextSyncService:
                 await self._propagate_change(change)
 
             except Exception as e:
-                logger.error(f"Error processing change {change.id}: {e}")
+                logger.error("Error processing change %s: %s", change.id, e)
 
     async def _propagate_change(self, change: ContextChange):
         """Propagate a change to target platforms"""
@@ -289,10 +289,10 @@ class ContextSyncService:
                 )
 
                 change.propagated_to.add(platform)
-                logger.debug(f"Propagated global change to {platform}")
+                logger.debug("Propagated global change to %s", platform)
 
             except Exception as e:
-                logger.error(f"Failed to propagate to {platform}: {e}")
+                logger.error("Failed to propagate to %s: %s", platform, e)
 
     async def _propagate_insights(self, change: ContextChange):
         """Propagate insights to other platforms"""
@@ -320,10 +320,10 @@ class ContextSyncService:
                         await self._platform_repo.update_platform_context(platform_context)
 
                         change.propagated_to.add(platform)
-                        logger.debug(f"Propagated insights from {change.source_platform} to {platform}")
+                        logger.debug("Propagated insights from %s to %s", change.source_platform, platform)
 
             except Exception as e:
-                logger.error(f"Failed to propagate insights to {platform}: {e}")
+                logger.error("Failed to propagate insights to %s: %s", platform, e)
 
     async def _propagate_domain_change(self, change: ContextChange):
         """Propagate domain context changes"""
@@ -343,7 +343,7 @@ class ContextSyncService:
                 change.propagated_to.add(platform)
 
             except Exception as e:
-                logger.error(f"Failed to propagate domain change to {platform}: {e}")
+                logger.error("Failed to propagate domain change to %s: %s", platform, e)
 
     async def _notify_subscribers(self, change: ContextChange):
         """Notify all subscribers of a change"""
@@ -537,7 +537,7 @@ class ContextSyncService:
     async def _store_pending_approval(self, change: ContextChange):
         """Store changes that require manual approval"""
         # Store in a pending approvals table/collection
-        logger.info(f"Change {change.id} requires approval: confidence {change.confidence_score}")
+        logger.info("Change %s requires approval: confidence %s", change.id, change.confidence_score)
 
     async def _analyze_error_patterns(
         self,
@@ -562,7 +562,7 @@ class ContextSyncService:
 
     async def force_sync_project(self, project_id: str):
         """Force synchronization of all contexts for a project"""
-        logger.info(f"Forcing sync for project {project_id}")
+        logger.info("Forcing sync for project %s", project_id)
 
         # Get global context
         global_context = await self._global_repo.get_global_context_by_project(project_id)
@@ -32,7 +32,7 @@ class UsersService(UsersServicePort):
         # Check if user with rudo_suid already exists
         existing_user = await self.users_repository.get_by_rudo_suid(rudo_suid)
         if existing_user:
-            logging.warning(f"User {rudo_suid} already exists")
+            logging.warning("User %s already exists", rudo_suid)
             return existing_user
         user = await self.dashboard_repository.get_user(rudo_suid)
         return await self.users_repository.create(user)
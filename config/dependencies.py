@@ -96,6 +96,20 @@ def get_ai_orchestrator() -> AIOrchestrator:
     )
 
 
+# FastAPI Providers
+# Declared async so FastAPI awaits them on the event loop; sync dependencies
+# are dispatched to the threadpool on every request.
+
+async def provide_context_service() -> ContextService:
+    """FastAPI dependency for the context service"""
+    return get_context_service()
+
+
+async def provide_ai_orchestrator() -> AIOrchestrator:
+    """FastAPI dependency for the AI orchestrator"""
+    return get_ai_orchestrator()
+
+
 # Clear cache function for testing
 def clear_dependency_cache():
     """Clear dependency cache (useful for testing)"""
@@ -107,4 +121,4 @@ def clear_dependency_cache():
     get_indexer.cache_clear()
     get_ai_adapter.cache_clear()
     get_context_service.cache_clear()
-    get_ai_orchestrator.cache_clear()
\ No newline at end of file
+    get_ai_orchestrator.cache_clear()
@@ -128,7 +128,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 DATABASES = {
     'default': {
-        "ENGINE": os.environ.get("DB_ENGINE"),
+        "ENGINE": os.environ.get("DB_ENGINE", 'django.db.backends.postgresql'),
         'NAME': os.environ.get('POSTGRES_DB'),
         'USER': os.environ.get('POSTGRES_USER'),
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
@@ -139,6 +139,24 @@ DATABASES = {
     }
 }
 
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    # psycopg 3 with server-side binding lets PostgreSQL prepare the repeated
+    # repository lookups (aget by id) after a few executions
+    DATABASES['default']['OPTIONS'] = {
+        'server_side_binding': True,
+        'prepare_threshold': int(os.environ.get('DB_PREPARE_THRESHOLD', 5)),
+        # Django's native psycopg pool: connections are checked out per query
+        # instead of being opened and torn down by each worker thread.
+        # The pool is per process, so workers * max_size must stay below
+        # PostgreSQL's max_connections (scripts/run_fastapi.sh sizes it)
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 30)),
+            # Seconds to wait for a free connection before failing the query
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 2.0)),
+        },
+    }
+
 USE_PUSH_NOTIFICATIONS = bool(int(os.environ.get('USE_PUSH_NOTIFICATIONS', "0")))
 
 if USE_PUSH_NOTIFICATIONS:
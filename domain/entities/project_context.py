@@ -1,11 +1,19 @@
 """Project Context Domain Entity for Unified Context Layer"""
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import Dict, List, Optional, Any
 from uuid import uuid4
 
 
-@dataclass
+_PROJECT_METADATA_FIELDS = (
+    "name", "description", "version", "repository_url",
+    "technologies", "team_members", "documentation_urls",
+)
+_project_metadata_values = attrgetter(*_PROJECT_METADATA_FIELDS)
+
+
+@dataclass(slots=True)
 class ProjectMetadata:
     """Project metadata information"""
     name: str
@@ -16,6 +24,10 @@ class ProjectMetadata:
     team_members: List[str] = field(default_factory=list)
     documentation_urls: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Public fields as a plain dict"""
+        return dict(zip(_PROJECT_METADATA_FIELDS, _project_metadata_values(self)))
+
 
 @dataclass
 class DomainContext:
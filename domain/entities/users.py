@@ -1,6 +1,9 @@
 from pydantic import BaseModel
 
 
+class Department(BaseModel): ...
+
+
 class BaseUser(BaseModel): ...
 
 
@@ -0,0 +1,13 @@
+"""Domain exceptions for the Unified Context Layer"""
+
+
+class UCLValidationError(ValueError):
+    """Operation cannot be applied to the current context state"""
+
+
+class UCLNotFoundError(UCLValidationError):
+    """Referenced context object does not exist"""
+
+
+class UCLConflictError(UCLValidationError):
+    """Operation conflicts with an existing context object"""
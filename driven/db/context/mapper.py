@@ -24,7 +24,7 @@ class ContextMapper:
 
     # Project Context mappings
 
-    async def entity_to_dbo(self, entity: ProjectContext) -> ProjectContextDBO:
+    def entity_to_dbo(self, entity: ProjectContext) -> ProjectContextDBO:
         """Convert ProjectContext entity to Django model"""
         return ProjectContextDBO(
             id=entity.id,
@@ -40,7 +40,7 @@ class ContextMapper:
             last_updated=entity.last_updated
         )
 
-    async def dbo_to_entity(self, dbo: ProjectContextDBO) -> ProjectContext:
+    def dbo_to_entity(self, dbo: ProjectContextDBO) -> ProjectContext:
         """Convert Django model to ProjectContext entity"""
         metadata = ProjectMetadata(
             name=dbo.name,
@@ -60,7 +60,7 @@ class ContextMapper:
             last_updated=dbo.last_updated
         )
 
-    async def update_dbo_from_entity(
+    def update_dbo_from_entity(
         self,
         dbo: ProjectContextDBO,
         entity: ProjectContext
@@ -79,15 +79,15 @@ class ContextMapper:
 
     # Domain Context mappings
 
-    async def domain_entity_to_dbo(
+    def domain_entity_to_dbo(
         self,
         entity: DomainContext,
-        project_dbo: ProjectContextDBO
+        project_id: str
     ) -> DomainContextDBO:
         """Convert DomainContext entity to Django model"""
         return DomainContextDBO(
             id=entity.id,
-            project=project_dbo,
+            project_id=project_id,
             domain_type=entity.domain_type,
             technologies=entity.technologies,
             file_patterns=entity.file_patterns,
@@ -99,7 +99,7 @@ class ContextMapper:
             last_updated=entity.last_updated
         )
 
-    async def domain_dbo_to_entity(self, dbo: DomainContextDBO) -> DomainContext:
+    def domain_dbo_to_entity(self, dbo: DomainContextDBO) -> DomainContext:
         """Convert Django model to DomainContext entity"""
         return DomainContext(
             id=str(dbo.id),
@@ -114,7 +114,7 @@ class ContextMapper:
             last_updated=dbo.last_updated
         )
 
-    async def update_domain_dbo_from_entity(
+    def update_domain_dbo_from_entity(
         self,
         dbo: DomainContextDBO,
         entity: DomainContext
@@ -133,15 +133,15 @@ class ContextMapper:
 
     # AI Session mappings
 
-    async def session_entity_to_dbo(
+    def session_entity_to_dbo(
         self,
         entity: AISession,
-        project_dbo: ProjectContextDBO
+        project_id: str
     ) -> AISessionDBO:
         """Convert AISession entity to Django model"""
         return AISessionDBO(
             id=entity.id,
-            project=project_dbo,
+            project_id=project_id,
             ai_type=entity.ai_type,
             session_start=entity.session_start,
             session_end=entity.session_end,
@@ -152,7 +152,7 @@ class ContextMapper:
             metadata=entity.metadata
         )
 
-    async def session_dbo_to_entity(self, dbo: AISessionDBO) -> AISession:
+    def session_dbo_to_entity(self, dbo: AISessionDBO) -> AISession:
         """Convert Django model to AISession entity"""
         return AISession(
             id=str(dbo.id),
@@ -166,7 +166,7 @@ class ContextMapper:
             metadata=dbo.metadata
         )
 
-    async def update_session_dbo_from_entity(
+    def update_session_dbo_from_entity(
         self,
         dbo: AISessionDBO,
         entity: AISession
@@ -184,17 +184,17 @@ class ContextMapper:
 
     # Context Query mappings
 
-    async def query_entity_to_dbo(
+    def query_entity_to_dbo(
         self,
         entity: ContextQuery,
-        project_dbo: ProjectContextDBO,
-        session_dbo: Optional[AISessionDBO] = None
+        project_id: str,
+        session_id: Optional[str] = None
     ) -> ContextQueryDBO:
         """Convert ContextQuery entity to Django model"""
         return ContextQueryDBO(
             id=entity.id,
-            project=project_dbo,
-            ai_session=session_dbo,
+            project_id=project_id,
+            ai_session_id=session_id,
             query_text=entity.query_text,
             domains_filter=entity.domains_filter,
             response_format=entity.response_format,
@@ -203,13 +203,13 @@ class ContextMapper:
             timestamp=entity.timestamp
         )
 
-    async def query_dbo_to_entity(self, dbo: ContextQueryDBO) -> ContextQuery:
+    def query_dbo_to_entity(self, dbo: ContextQueryDBO) -> ContextQuery:
         """Convert Django model to ContextQuery entity"""
         return ContextQuery(
             id=str(dbo.id),
             query_text=dbo.query_text,
             domains_filter=dbo.domains_filter,
-            ai_session_id=str(dbo.ai_session.id) if dbo.ai_session else None,
+            ai_session_id=str(dbo.ai_session_id) if dbo.ai_session_id else None,
             timestamp=dbo.timestamp,
             response_format=dbo.response_format,
             include_history=dbo.include_history,
@@ -218,17 +218,16 @@ class ContextMapper:
 
     # Context Response mappings
 
-    async def response_entity_to_dbo(
+    def response_entity_to_dbo(
         self,
         entity: ContextResponse,
-        project_dbo: ProjectContextDBO,
-        query_dbo: ContextQueryDBO
+        project_id: str
     ) -> ContextResponseDBO:
         """Convert ContextResponse entity to Django model"""
         return ContextResponseDBO(
             id=entity.query_id,  # Use query_id as response ID
-            query=query_dbo,
-            project=project_dbo,
+            query_id=entity.query_id,
+            project_id=project_id,
             results=entity.results,
             domains_found=entity.domains_found,
             total_results=entity.total_results,
@@ -237,14 +236,18 @@ class ContextMapper:
             timestamp=entity.timestamp
         )
 
-    async def response_dbo_to_entity(self, dbo: ContextResponseDBO) -> ContextResponse:
+    def response_dbo_to_entity(self, dbo: ContextResponseDBO) -> ContextResponse:
         """Convert Django model to ContextResponse entity"""
         return ContextResponse(
-            query_id=str(dbo.query.id),
+            query_id=str(dbo.query_id),
             results=dbo.results,
             domains_found=dbo.domains_found,
             total_results=dbo.total_results,
             processing_time_ms=dbo.processing_time_ms,
             metadata=dbo.metadata,
             timestamp=dbo.timestamp
-        )
\ No newline at end of file
+        )
+
+
+# Mappers are stateless, so a single shared instance serves every repository
+context_mapper = ContextMapper()
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('context', '0003_alter_aisessiondbo_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='aisessiondbo',
+            name='ucl_ai_sess_project_115169_idx',
+        ),
+        migrations.AddIndex(
+            model_name='aisessiondbo',
+            index=models.Index(fields=['project', 'ai_type', '-session_start'], name='ai_sessions_project_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aisessiondbo',
+            index=models.Index(fields=['project', '-session_start'], name='ai_sessions_project_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aisessiondbo',
+            index=models.Index(condition=models.Q(('session_end__isnull', True)), fields=['project', 'session_end'], name='active_sessions_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contextquerydbo',
+            index=models.Index(fields=['project', 'ai_session', '-timestamp'], name='queries_project_session_idx'),
+        ),
+    ]
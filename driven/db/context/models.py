@@ -132,7 +132,13 @@ class AISessionDBO(models.Model):
         verbose_name = 'Sesión de IA'
         verbose_name_plural = 'Sesiones de IA'
         indexes = [
-            models.Index(fields=['project', 'ai_type']),
+            models.Index(fields=['project', 'ai_type', '-session_start'], name='ai_sessions_project_type_idx'),
+            models.Index(fields=['project', '-session_start'], name='ai_sessions_project_start_idx'),
+            models.Index(
+                fields=['project', 'session_end'],
+                condition=models.Q(session_end__isnull=True),
+                name='active_sessions_idx'
+            ),
             models.Index(fields=['session_start']),
             models.Index(fields=['session_end']),
             models.Index(fields=['ai_instance_id']),
@@ -195,6 +201,7 @@ class ContextQueryDBO(models.Model):
         verbose_name_plural = 'Consultas'
         indexes = [
             models.Index(fields=['project', 'timestamp']),
+            models.Index(fields=['project', 'ai_session', '-timestamp'], name='queries_project_session_idx'),
             models.Index(fields=['ai_session']),
             models.Index(fields=['query_text']),
         ]
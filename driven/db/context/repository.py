@@ -1,8 +1,10 @@
 """Repository implementation for Unified Context Layer"""
+import copy
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
-from django.db import transaction
+from cachetools import TTLCache
+from django.db import IntegrityError, transaction
 from django.db.models import Q, Count
 from django.utils import timezone
 
@@ -14,6 +16,7 @@ from domain.entities.project_context import (
     ContextResponse,
     ProjectMetadata
 )
+from domain.exceptions import UCLConflictError, UCLNotFoundError, UCLValidationError
 from application.ports.context_repository import (
     ContextRepositoryPort,
     DomainContextRepositoryPort,
@@ -27,34 +30,113 @@ from .models import (
     ContextQueryDBO,
     ContextResponseDBO
 )
-from .mapper import ContextMapper
+from .mapper import context_mapper
+
+# Project contexts change rarely, so reads are served from a short-lived
+# per-process cache that is invalidated by the writes below. Writes handled by
+# another worker are not seen here until the entry expires.
+PROJECT_CACHE_TTL = 60
+_project_cache: TTLCache = TTLCache(maxsize=1024, ttl=PROJECT_CACHE_TTL)
+_PROJECT_LIST_KEY = ("list",)
+
+# Project ids known to exist, so writes can skip the FK validation SELECT.
+# A project deleted elsewhere still surfaces as a foreign key violation on insert.
+_valid_projects: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# SQLSTATE of foreign_key_violation; other integrity errors are conflicts
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _cache_get(key: tuple) -> Any:
+    """Return a private copy of a cached value, callers mutate entities freely"""
+    cached = _project_cache.get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _cache_set(key: tuple, value: Any) -> None:
+    _project_cache[key] = copy.deepcopy(value)
+
+
+def _is_missing_reference(error: IntegrityError) -> bool:
+    """True when the insert failed because a referenced row does not exist"""
+    cause = error.__cause__
+    return (
+        getattr(cause, "sqlstate", None) == _FOREIGN_KEY_VIOLATION
+        or getattr(cause, "pgcode", None) == _FOREIGN_KEY_VIOLATION
+        or "FOREIGN KEY constraint failed" in str(error)  # SQLite
+    )
+
+
+def _integrity_error(error: IntegrityError, project_id: str, not_found: str) -> UCLValidationError:
+    """Map a failed insert to not-found for a missing reference, conflict otherwise"""
+    if _is_missing_reference(error):
+        _forget_project(project_id)
+        return UCLNotFoundError(not_found)
+    return UCLConflictError(f"Conflicts with an existing object: {error}")
+
+
+async def _ensure_project(project_id: str) -> None:
+    """Raise ValueError unless the project exists, checking the cache first"""
+    key = str(project_id)
+    if key in _valid_projects:
+        return
+    if not await ProjectContextDBO.objects.filter(id=project_id).aexists():
+        raise UCLNotFoundError(f"Project {project_id} not found")
+    _valid_projects[key] = True
+
+
+def _forget_project(project_id: str) -> None:
+    _valid_projects.pop(str(project_id), None)
+
+
+def _invalidate_project(project_id: str, *names: str) -> None:
+    _project_cache.pop(("id", str(project_id)), None)
+    for name in names:
+        _project_cache.pop(("name", name), None)
+    _project_cache.pop(_PROJECT_LIST_KEY, None)
 
 
 class ContextRepository(ContextRepositoryPort):
     """Django implementation of context repository"""
 
     def __init__(self):
-        self.mapper = ContextMapper()
+        self.mapper = context_mapper
 
     async def create_project_context(self, context: ProjectContext) -> ProjectContext:
         """Create a new project context"""
-        dbo = await self.mapper.entity_to_dbo(context)
+        dbo = self.mapper.entity_to_dbo(context)
         await dbo.asave()
-        return await self.mapper.dbo_to_entity(dbo)
+        _invalidate_project(dbo.id, dbo.name)
+        # The entity already holds everything but the auto_now timestamp
+        context.id = str(dbo.id)
+        context.last_updated = dbo.last_updated
+        return context
 
     async def get_project_context(self, project_id: str) -> Optional[ProjectContext]:
         """Get project context by ID"""
+        key = ("id", str(project_id))
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         try:
             dbo = await ProjectContextDBO.objects.aget(id=project_id)
-            return await self.mapper.dbo_to_entity(dbo)
+            entity = self.mapper.dbo_to_entity(dbo)
+            _cache_set(key, entity)
+            return entity
         except ProjectContextDBO.DoesNotExist:
             return None
 
     async def get_project_context_by_name(self, name: str) -> Optional[ProjectContext]:
         """Get project context by project name"""
+        key = ("name", name)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         try:
             dbo = await ProjectContextDBO.objects.aget(name=name)
-            return await self.mapper.dbo_to_entity(dbo)
+            entity = self.mapper.dbo_to_entity(dbo)
+            _cache_set(key, entity)
+            return entity
         except ProjectContextDBO.DoesNotExist:
             return None
 
@@ -62,27 +144,35 @@ class ContextRepository(ContextRepositoryPort):
         """Update existing project context"""
         try:
             dbo = await ProjectContextDBO.objects.aget(id=context.id)
-            updated_dbo = await self.mapper.update_dbo_from_entity(dbo, context)
+            previous_name = dbo.name
+            updated_dbo = self.mapper.update_dbo_from_entity(dbo, context)
             await updated_dbo.asave()
-            return await self.mapper.dbo_to_entity(updated_dbo)
+            _invalidate_project(updated_dbo.id, previous_name, updated_dbo.name)
+            return self.mapper.dbo_to_entity(updated_dbo)
         except ProjectContextDBO.DoesNotExist:
-            raise ValueError(f"Project context {context.id} not found")
+            raise UCLNotFoundError(f"Project context {context.id} not found")
 
     async def delete_project_context(self, project_id: str) -> bool:
         """Delete project context"""
         try:
             dbo = await ProjectContextDBO.objects.aget(id=project_id)
             await dbo.adelete()
+            _invalidate_project(project_id, dbo.name)
+            _forget_project(project_id)
             return True
         except ProjectContextDBO.DoesNotExist:
             return False
 
     async def list_project_contexts(self) -> List[ProjectContext]:
         """List all project contexts"""
+        cached = _cache_get(_PROJECT_LIST_KEY)
+        if cached is not None:
+            return cached
         contexts = []
         async for dbo in ProjectContextDBO.objects.all():
-            entity = await self.mapper.dbo_to_entity(dbo)
+            entity = self.mapper.dbo_to_entity(dbo)
             contexts.append(entity)
+        _cache_set(_PROJECT_LIST_KEY, contexts)
         return contexts
 
 
@@ -90,23 +180,25 @@ class DomainContextRepository(DomainContextRepositoryPort):
     """Django implementation of domain context repository"""
 
     def __init__(self):
-        self.mapper = ContextMapper()
+        self.mapper = context_mapper
 
     async def create_domain_context(self, domain: DomainContext, project_id: str) -> DomainContext:
         """Create domain context for a project"""
         try:
-            project_dbo = await ProjectContextDBO.objects.aget(id=project_id)
-            dbo = await self.mapper.domain_entity_to_dbo(domain, project_dbo)
+            await _ensure_project(project_id)
+            dbo = self.mapper.domain_entity_to_dbo(domain, project_id)
             await dbo.asave()
-            return await self.mapper.domain_dbo_to_entity(dbo)
-        except ProjectContextDBO.DoesNotExist:
-            raise ValueError(f"Project {project_id} not found")
+            domain.id = str(dbo.id)
+            domain.last_updated = dbo.last_updated
+            return domain
+        except IntegrityError as e:
+            raise _integrity_error(e, project_id, f"Project {project_id} not found") from e
 
     async def get_domain_context(self, domain_id: str) -> Optional[DomainContext]:
         """Get domain context by ID"""
         try:
             dbo = await DomainContextDBO.objects.aget(id=domain_id)
-            return await self.mapper.domain_dbo_to_entity(dbo)
+            return self.mapper.domain_dbo_to_entity(dbo)
         except DomainContextDBO.DoesNotExist:
             return None
 
@@ -114,7 +206,7 @@ class DomainContextRepository(DomainContextRepositoryPort):
         """Get all domains for a project"""
         domains = []
         async for dbo in DomainContextDBO.objects.filter(project_id=project_id):
-            entity = await self.mapper.domain_dbo_to_entity(dbo)
+            entity = self.mapper.domain_dbo_to_entity(dbo)
             domains.append(entity)
         return domains
 
@@ -125,7 +217,7 @@ class DomainContextRepository(DomainContextRepositoryPort):
                 project_id=project_id,
                 domain_type=domain_type
             )
-            return await self.mapper.domain_dbo_to_entity(dbo)
+            return self.mapper.domain_dbo_to_entity(dbo)
         except DomainContextDBO.DoesNotExist:
             return None
 
@@ -133,11 +225,11 @@ class DomainContextRepository(DomainContextRepositoryPort):
         """Update domain context"""
         try:
             dbo = await DomainContextDBO.objects.aget(id=domain.id)
-            updated_dbo = await self.mapper.update_domain_dbo_from_entity(dbo, domain)
+            updated_dbo = self.mapper.update_domain_dbo_from_entity(dbo, domain)
             await updated_dbo.asave()
-            return await self.mapper.domain_dbo_to_entity(updated_dbo)
+            return self.mapper.domain_dbo_to_entity(updated_dbo)
         except DomainContextDBO.DoesNotExist:
-            raise ValueError(f"Domain context {domain.id} not found")
+            raise UCLNotFoundError(f"Domain context {domain.id} not found")
 
     async def delete_domain_context(self, domain_id: str) -> bool:
         """Delete domain context"""
@@ -169,7 +261,7 @@ class DomainContextRepository(DomainContextRepositoryPort):
 
         domains = []
         async for dbo in DomainContextDBO.objects.filter(q_filter):
-            entity = await self.mapper.domain_dbo_to_entity(dbo)
+            entity = self.mapper.domain_dbo_to_entity(dbo)
             domains.append(entity)
         return domains
 
@@ -178,23 +270,24 @@ class AISessionRepository(AISessionRepositoryPort):
     """Django implementation of AI session repository"""
 
     def __init__(self):
-        self.mapper = ContextMapper()
+        self.mapper = context_mapper
 
     async def create_ai_session(self, session: AISession, project_id: str) -> AISession:
         """Create AI session for a project"""
         try:
-            project_dbo = await ProjectContextDBO.objects.aget(id=project_id)
-            dbo = await self.mapper.session_entity_to_dbo(session, project_dbo)
+            await _ensure_project(project_id)
+            dbo = self.mapper.session_entity_to_dbo(session, project_id)
             await dbo.asave()
-            return await self.mapper.session_dbo_to_entity(dbo)
-        except ProjectContextDBO.DoesNotExist:
-            raise ValueError(f"Project {project_id} not found")
+            session.id = str(dbo.id)
+            return session
+        except IntegrityError as e:
+            raise _integrity_error(e, project_id, f"Project {project_id} not found") from e
 
     async def get_ai_session(self, session_id: str) -> Optional[AISession]:
         """Get AI session by ID"""
         try:
             dbo = await AISessionDBO.objects.aget(id=session_id)
-            return await self.mapper.session_dbo_to_entity(dbo)
+            return self.mapper.session_dbo_to_entity(dbo)
         except AISessionDBO.DoesNotExist:
             return None
 
@@ -202,7 +295,7 @@ class AISessionRepository(AISessionRepositoryPort):
         """Get all sessions for a project"""
         sessions = []
         async for dbo in AISessionDBO.objects.filter(project_id=project_id).order_by('-session_start'):
-            entity = await self.mapper.session_dbo_to_entity(dbo)
+            entity = self.mapper.session_dbo_to_entity(dbo)
             sessions.append(entity)
         return sessions
 
@@ -213,7 +306,7 @@ class AISessionRepository(AISessionRepositoryPort):
             project_id=project_id,
             session_end__isnull=True
         ):
-            entity = await self.mapper.session_dbo_to_entity(dbo)
+            entity = self.mapper.session_dbo_to_entity(dbo)
             sessions.append(entity)
         return sessions
 
@@ -221,11 +314,11 @@ class AISessionRepository(AISessionRepositoryPort):
         """Update AI session"""
         try:
             dbo = await AISessionDBO.objects.aget(id=session.id)
-            updated_dbo = await self.mapper.update_session_dbo_from_entity(dbo, session)
+            updated_dbo = self.mapper.update_session_dbo_from_entity(dbo, session)
             await updated_dbo.asave()
-            return await self.mapper.session_dbo_to_entity(updated_dbo)
+            return self.mapper.session_dbo_to_entity(updated_dbo)
         except AISessionDBO.DoesNotExist:
-            raise ValueError(f"AI session {session.id} not found")
+            raise UCLNotFoundError(f"AI session {session.id} not found")
 
     async def end_ai_session(self, session_id: str) -> Optional[AISession]:
         """End AI session"""
@@ -233,7 +326,7 @@ class AISessionRepository(AISessionRepositoryPort):
             dbo = await AISessionDBO.objects.aget(id=session_id)
             dbo.session_end = timezone.now()
             await dbo.asave()
-            return await self.mapper.session_dbo_to_entity(dbo)
+            return self.mapper.session_dbo_to_entity(dbo)
         except AISessionDBO.DoesNotExist:
             return None
 
@@ -254,7 +347,7 @@ class AISessionRepository(AISessionRepositoryPort):
 
         sessions = []
         async for dbo in queryset:
-            entity = await self.mapper.session_dbo_to_entity(dbo)
+            entity = self.mapper.session_dbo_to_entity(dbo)
             sessions.append(entity)
         return sessions
 
@@ -263,33 +356,32 @@ class ContextQueryRepository(ContextQueryRepositoryPort):
     """Django implementation of context query repository"""
 
     def __init__(self):
-        self.mapper = ContextMapper()
+        self.mapper = context_mapper
 
     async def save_query(self, query: ContextQuery, project_id: str) -> ContextQuery:
         """Save context query"""
         try:
-            project_dbo = await ProjectContextDBO.objects.aget(id=project_id)
-            session_dbo = None
-            if query.ai_session_id:
-                session_dbo = await AISessionDBO.objects.aget(id=query.ai_session_id)
-
-            dbo = await self.mapper.query_entity_to_dbo(query, project_dbo, session_dbo)
+            await _ensure_project(project_id)
+            # A missing session surfaces as a foreign key violation on insert
+            dbo = self.mapper.query_entity_to_dbo(query, project_id, query.ai_session_id)
             await dbo.asave()
-            return await self.mapper.query_dbo_to_entity(dbo)
-        except (ProjectContextDBO.DoesNotExist, AISessionDBO.DoesNotExist) as e:
-            raise ValueError(f"Related object not found: {e}")
+            query.id = str(dbo.id)
+            return query
+        except IntegrityError as e:
+            raise _integrity_error(e, project_id, f"Related object not found: {e}") from e
 
     async def save_response(self, response: ContextResponse, project_id: str) -> ContextResponse:
         """Save context response"""
         try:
-            project_dbo = await ProjectContextDBO.objects.aget(id=project_id)
-            query_dbo = await ContextQueryDBO.objects.aget(id=response.query_id)
+            await _ensure_project(project_id)
+            if not await ContextQueryDBO.objects.filter(id=response.query_id).aexists():
+                raise UCLNotFoundError(f"Context query {response.query_id} not found")
 
-            dbo = await self.mapper.response_entity_to_dbo(response, project_dbo, query_dbo)
+            dbo = self.mapper.response_entity_to_dbo(response, project_id)
             await dbo.asave()
-            return await self.mapper.response_dbo_to_entity(dbo)
-        except (ProjectContextDBO.DoesNotExist, ContextQueryDBO.DoesNotExist) as e:
-            raise ValueError(f"Related object not found: {e}")
+            return response
+        except IntegrityError as e:
+            raise _integrity_error(e, project_id, f"Related object not found: {e}") from e
 
     async def get_query_history(
         self,
@@ -308,7 +400,7 @@ class ContextQueryRepository(ContextQueryRepositoryPort):
 
         queries = []
         async for dbo in queryset:
-            entity = await self.mapper.query_dbo_to_entity(dbo)
+            entity = self.mapper.query_dbo_to_entity(dbo)
             queries.append(entity)
         return queries
 
@@ -353,6 +445,6 @@ class ContextQueryRepository(ContextQueryRepositoryPort):
 
         queries = []
         async for dbo in queryset:
-            entity = await self.mapper.query_dbo_to_entity(dbo)
+            entity = self.mapper.query_dbo_to_entity(dbo)
             queries.append(entity)
         return queries
\ No newline at end of file
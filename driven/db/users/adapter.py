@@ -3,8 +3,8 @@ from typing import List, Optional
 from application.ports.driven.db.users.repository_port import \
     UsersRepositoryPort
 from domain.entities.users import User
-from driven.db.users.mapper import UserDBOMapper
-from driven.db.users.models import UserDBO
+from driven.db.users.mapper import user_dbo_mapper
+from driven.db.users.models import DepartmentDBO, UserDBO
 
 # Type ignores for Django async ORM methods - these exist at runtime but type checker doesn't know about them
 # mypy: disable-error-code=attr-defined
@@ -14,18 +14,18 @@ class UsersDBRepositoryAdapter(UsersRepositoryPort):
     """Implementation of User repository using Django ORM async methods"""
 
     def __init__(self):
-        self.mapper = UserDBOMapper()
+        self.mapper = user_dbo_mapper
 
     async def create(self, user: User) -> User:
         """Create a new user"""
         # Use Django's native async save method
-        dbo = await self.mapper.entity_to_dbo(user)
+        dbo = self.mapper.entity_to_dbo(user)
         await dbo.asave()
 
         # Add any M2M field using async methods
+        departments = []
         if user.departments:
             department_names = [dept.name for dept in user.departments]
-            departments = []
             departments_qs = DepartmentDBO.objects.filter(name__in=department_names)
             if not await departments_qs.aexists():
                 for dept_name in department_names:
@@ -36,9 +36,9 @@ class UsersDBRepositoryAdapter(UsersRepositoryPort):
                     departments.append(dept)
             await dbo.departments.aset(departments)
 
-        # Refresh and return
-        await dbo.arefresh_from_db()
-        return await self.mapper.dbo_to_entity(dbo)
+        # Build the entity from the saved DBO and the departments we already
+        # hold, instead of refreshing and re-querying the M2M relation
+        return self.mapper.build_entity(dbo, departments)
 
     async def get_all(self) -> List[User]:
         """Get all users"""
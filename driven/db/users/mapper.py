@@ -1,11 +1,11 @@
 from typing import List
 
-from domain.entities.users import BaseUser, User
-from driven.db.users.models import UserDBO
+from domain.entities.users import BaseUser, Department, User
+from driven.db.users.models import DepartmentDBO, UserDBO
 
 
 class UserDBOMapper:
-    async def entity_to_dbo(self, entity: User) -> UserDBO:
+    def entity_to_dbo(self, entity: User) -> UserDBO:
         return UserDBO(
             first_name=entity.first_name,
             last_name=entity.last_name,
@@ -16,11 +16,11 @@ class UserDBOMapper:
             sesame_id=entity.sesame_id,
         )
 
-    async def dbo_to_entity(self, dbo: UserDBO) -> User:
-        departments = []
-        async for dept in dbo.departments.all():
-            departments.append(Department(id=dept.id, name=dept.name))
+    def dbo_to_entity(self, dbo: UserDBO) -> User:
+        # Expects departments to be prefetched so this stays in memory
+        return self.build_entity(dbo, list(dbo.departments.all()))
 
+    def build_entity(self, dbo: UserDBO, departments: List[DepartmentDBO]) -> User:
         return User(
             id=dbo.id,
             first_name=dbo.first_name,
@@ -31,5 +31,8 @@ class UserDBOMapper:
             bitbucket_account_id=dbo.bitbucket_account_id,
             sesame_id=dbo.sesame_id,
             is_active=dbo.is_active,
-            departments=departments,
+            departments=[Department(id=dept.id, name=dept.name) for dept in departments],
         )
+
+
+user_dbo_mapper = UserDBOMapper()
@@ -1,9 +1,11 @@
-import json
+import logging
 import os
+import sys
 import time
-from typing import Callable
+from typing import Any, Callable, Dict, Optional
 
 import django
+import orjson
 from commons_package.commons.fast_api.classes import CustomRequest as Request
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,14 +14,34 @@ from starlette.authentication import (AuthCredentials, AuthenticationBackend,
                                       AuthenticationError, SimpleUser)
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import Message
 
 # Setup Django before importing adapters
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.staticfiles')
 django.setup()
 
+from django.db import OperationalError
+
+from domain.exceptions import UCLConflictError, UCLNotFoundError, UCLValidationError
 from driving.api.users.adapter import UsersAPIAdapter
 from driving.api.v1.context.adapter import router as context_router
 
+logger = logging.getLogger(__name__)
+
+# Request capture is a debugging aid, resolve the flag once at import time
+_DEBUG = bool(int(os.environ.get('DEBUG', 0)))
+
+_SECURITY_HEADERS = frozenset({'authorization', 'cookie', 'x-api-key', 'x-auth-token'})
+_BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+# Request bodies are never buffered by the middleware, only this many bytes are copied
+_MAX_BODY_PEEK = 4096
+
+
+def _write_log(payload: Dict[str, Any]) -> None:
+    """Write a log record as a single JSON line to stdout"""
+    sys.stdout.buffer.write(orjson.dumps(payload, default=str) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class RequestCaptureMiddleware(BaseHTTPMiddleware):
     """Custom middleware to capture all HTTP requests with headers and body"""
@@ -28,21 +50,50 @@ class RequestCaptureMiddleware(BaseHTTPMiddleware):
         # Start timing
         start_time = time.time()
 
-        # Capture request data if DEBUG is enabled
-        if bool(int(os.environ.get('DEBUG', 0))):
-            await self._capture_request(request, start_time)
+        # Capture request data (only registered when DEBUG is enabled)
+        await self._capture_request(request, start_time)
+        if request.method in _BODY_METHODS:
+            self._install_body_peek(request)
 
         # Process the request
         response = await call_next(request)
 
-        # Log completion
-        process_time = time.time() - start_time
-        print(
-            f"[REQUEST COMPLETED] {request.method} {request.url.path} - {response.status_code} ({process_time:.4f}s)\n"
-        )
+        # Log completion, including the body bytes the handler consumed
+        _write_log({
+            "event": "request_completed",
+            "method": request.method,
+            "path": request.url.path,
+            "status_code": response.status_code,
+            "process_time": round(time.time() - start_time, 4),
+            "body": self._peeked_body(request),
+        })
 
         return response
 
+    def _install_body_peek(self, request: Request) -> None:
+        """Copy the first bytes of the body as the handler streams it"""
+        receive = request._receive
+        peek = bytearray()
+        request.state.peek = peek
+
+        async def peek_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(peek) < _MAX_BODY_PEEK:
+                peek.extend(message.get("body", b"")[:_MAX_BODY_PEEK - len(peek)])
+            return message
+
+        request._receive = peek_receive
+
+    def _peeked_body(self, request: Request) -> Optional[Dict[str, Any]]:
+        """Decode the peeked body bytes, if any"""
+        peek = getattr(request.state, "peek", None)
+        if not peek:
+            return None
+        try:
+            return orjson.loads(peek)
+        except orjson.JSONDecodeError:
+            return {"raw_body": peek[:1000].decode(errors="replace")}  # Limit size
+
     async def _capture_request(self, request: Request, start_time: float):
         """Capture and log request details"""
 
@@ -53,83 +104,31 @@ class RequestCaptureMiddleware(BaseHTTPMiddleware):
 
         for key, value in request.headers.items():
             key_lower = key.lower()
-            if key_lower.startswith('x-'):
-                custom_headers[key] = value
-            elif key_lower in ['authorization', 'cookie', 'x-api-key', 'x-auth-token']:
+            if key_lower in _SECURITY_HEADERS:
                 security_headers[key] = (
                     f"[HIDDEN - {len(value)} chars]" if value else None
                 )
+            elif key_lower.startswith('x-'):
+                custom_headers[key] = value
             else:
                 standard_headers[key] = value
 
-        # Capture request body for POST/PUT/PATCH
-        body_data = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                # Read the body
-                body = await request.body()
-                if body:
-                    try:
-                        body_data = json.loads(body.decode())
-                    except json.JSONDecodeError:
-                        body_data = {"raw_body": body.decode()[:1000]}  # Limit size
-            except Exception as e:
-                body_data = {"error": f"Could not read body: {str(e)}"}
-
-        # Format and print the captured data
-        print(f"\n[MIDDLEWARE REQUEST CAPTURED]")
-        print("=" * 70)
-        print(
-            f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}"
-        )
-        print(f"Method: {request.method}")
-        print(f"URL: {request.url}")
-        print(f"Path: {request.url.path}")
-        print(
-            f"Client: {request.client.host}:{request.client.port}"
-            if request.client
-            else "Client: Unknown"
-        )
-        print(f"User Agent: {request.headers.get('user-agent', 'Not provided')}")
-
-        # Query parameters
-        if request.query_params:
-            print(f"Query Params: {dict(request.query_params)}")
-
-        # Path parameters
-        if hasattr(request, 'path_params') and request.path_params:
-            print(f"Path Params: {request.path_params}")
-
-        # Headers
-        print(f"\nHEADERS:")
-        print("─" * 40)
-
-        if standard_headers:
-            print("Standard Headers:")
-            for key, value in standard_headers.items():
-                print(f"   {key}: {value}")
-
-        if custom_headers:
-            print("\nCustom Headers (X-*):")
-            for key, value in custom_headers.items():
-                print(f"   {key}: {value}")
-
-        if security_headers:
-            print("\nSecurity Headers:")
-            for key, value in security_headers.items():
-                print(f"   {key}: {value}")
-
-        # Request body
-        if body_data:
-            print(f"\nRequest Body:")
-            if isinstance(body_data, dict) and "raw_body" in body_data:
-                print(f"   Raw: {body_data['raw_body']}")
-            elif isinstance(body_data, dict) and "error" in body_data:
-                print(f"   Error: {body_data['error']}")
-            else:
-                print(json.dumps(body_data, indent=4))
-
-        print("=" * 70)
+        _write_log({
+            "event": "request_captured",
+            "timestamp": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time)),
+            "method": request.method,
+            "url": str(request.url),
+            "path": request.url.path,
+            "client": f"{request.client.host}:{request.client.port}" if request.client else None,
+            "user_agent": request.headers.get('user-agent'),
+            "query_params": dict(request.query_params) or None,
+            "path_params": getattr(request, 'path_params', None) or None,
+            "headers": {
+                "standard": standard_headers,
+                "custom": custom_headers,
+                "security": security_headers,
+            },
+        })
 
 
 def create_fastapi_app() -> FastAPI:
@@ -145,6 +144,30 @@ def create_fastapi_app() -> FastAPI:
     )
 
     # Add exception handlers
+    @app.exception_handler(OperationalError)
+    async def database_unavailable_handler(request: Request, exc: OperationalError):
+        """Fail fast with 503 when no database connection can be acquired"""
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Service busy"},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(UCLNotFoundError)
+    async def not_found_handler(request: Request, exc: UCLNotFoundError):
+        """Map missing context objects to 404"""
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+    @app.exception_handler(UCLConflictError)
+    async def conflict_handler(request: Request, exc: UCLConflictError):
+        """Map writes clashing with an existing object to 409"""
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
+    @app.exception_handler(UCLValidationError)
+    async def validation_error_handler(request: Request, exc: UCLValidationError):
+        """Map rejected operations to 400; other ValueErrors are internal errors"""
+        logger.warning("Rejected %s %s: %s", request.method, request.url.path, exc)
+        return JSONResponse(status_code=400, content={"detail": str(exc)})
 
     # CORS middleware
     app.add_middleware(
@@ -156,7 +179,8 @@ def create_fastapi_app() -> FastAPI:
     )
 
     # app.add_middleware(AuthenticationMiddleware, backend=BearerTokenBackend())
-    app.add_middleware(RequestCaptureMiddleware)
+    if _DEBUG:
+        app.add_middleware(RequestCaptureMiddleware)
 
     # Initialize adapters
     users_adapter = UsersAPIAdapter()
@@ -1,4 +1,3 @@
-import asyncio
 from typing import List
 
 from commons_package.commons.fast_api.classes import CustomRequest as Request
@@ -35,7 +34,6 @@ class UsersAPIAdapter(UsersAPIPort):
     ) -> List[UserResponse]:
         """Get all users"""
         users = await users_service.get_all_users()
-        users = await asyncio.gather(*users)
         return [self.mapper.entity_to_response(user).model_dump() for user in users]
 
     @post("/", response_model=UserResponse, status_code=status.HTTP_200_OK)
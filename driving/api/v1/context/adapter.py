@@ -1,12 +1,25 @@
 """FastAPI adapter for Unified Context Layer"""
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Header, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from typing import AsyncIterator, List, Optional, Dict, Any
+from datetime import datetime, timezone
+from email.utils import format_datetime
 import logging
 
+import orjson
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
+
 from application.services.context_service import ContextService
 from application.services.ai_orchestrator_service import AIOrchestrator
-from config.dependencies import get_context_service, get_ai_orchestrator
+from application.ports.ai_adapter_port import (
+    AICapabilities,
+    AIContextRequest as AIContextRequestPort,
+    AIContextUpdate as AIContextUpdatePort
+)
+from config.dependencies import provide_context_service, provide_ai_orchestrator
+from domain.entities.project_context import AISession
 from .schemas import (
     ProjectContextCreate,
     ProjectContextResponse,
@@ -42,639 +55,846 @@ from .schemas import (
 logger = logging.getLogger(__name__)
 
 # Router for UCL endpoints
-router = APIRouter(prefix="/ucl", tags=["Unified Context Layer"])
+router = APIRouter(
+    prefix="/ucl",
+    tags=["Unified Context Layer"],
+    default_response_class=ORJSONResponse
+)
+
+# Short-lived response caches for read-heavy GETs, keyed by (project_id, *params).
+# A None project_id marks entries that span every project, like the project list.
+# Invalidation only reaches this worker; with several workers, the others keep
+# serving their entries until the TTL expires, on top of the repository cache.
+_response_caches: Dict[str, TTLCache] = {
+    "projects": TTLCache(maxsize=4096, ttl=60),
+    "global_context": TTLCache(maxsize=4096, ttl=60),
+    "platform_contexts": TTLCache(maxsize=4096, ttl=60),
+    "domains": TTLCache(maxsize=1024, ttl=30),
+    "project_analytics": TTLCache(maxsize=256, ttl=60),
+    "ai_analytics": TTLCache(maxsize=256, ttl=300),
+}
+
+# Idempotency keys of accepted AI context updates, keyed by (project_id, key), so a
+# retried POST is acknowledged without being applied twice
+_accepted_ai_updates: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 3600)
+
+# Bumped on every invalidation. A read only stores what it loaded when no write
+# landed while it was awaiting the repository, so stale rows never re-enter.
+_cache_generation = 0
+
+
+def _not_found(detail: str) -> HTTPException:
+    """Fresh 404 per raise, so concurrent requests never share traceback state"""
+    return HTTPException(status_code=404, detail=detail)
+
+
+def _cache_bypassed(cache_control: Optional[str]) -> bool:
+    return bool(cache_control) and "no-cache" in cache_control
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _validators(*stamps: datetime, count: int = 1) -> Dict[str, str]:
+    """Weak ETag and Last-Modified headers derived from entity timestamps"""
+    latest = max(stamps, default=_EPOCH)
+    if latest.tzinfo is None:
+        latest = latest.replace(tzinfo=timezone.utc)
+    return {
+        "ETag": f'W/"{count:x}-{int(latest.timestamp() * 1000):x}"',
+        "Last-Modified": format_datetime(latest.astimezone(timezone.utc), usegmt=True),
+    }
+
 
+def _not_modified(if_none_match: Optional[str], headers: Dict[str, str]) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or headers["ETag"] in tags
 
-class ContextAdapter:
-    """FastAPI adapter for context operations"""
 
-    def __init__(self, context_service: ContextService, ai_orchestrator: AIOrchestrator):
-        self._context_service = context_service
-        self._ai_orchestrator = ai_orchestrator
+def _store_response(name: str, key: tuple, payload: Any, generation: int) -> None:
+    """Cache a payload unless an invalidation happened since generation was read"""
+    if generation == _cache_generation:
+        _response_caches[name][key] = payload
 
-    # Project Context Endpoints
 
-    @router.post("/projects", response_model=ProjectContextResponse)
-    async def create_project_context(
-        self,
-        request: ProjectContextCreate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Create new project context"""
+def _invalidate_project_responses(project_id: str, *names: str) -> None:
+    """Drop cached responses for a project, optionally only in the named caches"""
+    global _cache_generation
+    _cache_generation += 1
+    for name in names or _response_caches:
+        cache = _response_caches[name]
+        for key in [key for key in cache if key[0] in (project_id, None)]:
+            cache.pop(key, None)
+
+
+def _clear_responses(*names: str) -> None:
+    """Drop every cached response in the named caches"""
+    global _cache_generation
+    _cache_generation += 1
+    for name in names:
+        _response_caches[name].clear()
+
+
+def _json_body(model: type[BaseModel]):
+    """Dependency that parses and validates a JSON body in one pydantic-core pass"""
+    async def parse(request: Request) -> BaseModel:
         try:
-            context = await context_service.create_project_context(
-                name=request.project_metadata.name,
-                description=request.project_metadata.description,
-                technologies=request.project_metadata.technologies,
-                repository_url=str(request.project_metadata.repository_url) if request.project_metadata.repository_url else None
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
             )
-            return self._project_context_to_response(context)
-        except Exception as e:
-            logger.error(f"Error creating project context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.get("/projects/{project_id}", response_model=ProjectContextResponse)
-    async def get_project_context(
-        self,
-        project_id: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get project context by ID"""
+    return parse
+
+
+def _json_body_openapi(model: type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for routes that read it through _json_body"""
+    return {"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": model.model_json_schema()}}
+    }}
+
+
+# Project Context Endpoints
+
+@router.post("/projects", response_model=ProjectContextResponse)
+async def create_project_context(
+    request: ProjectContextCreate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Create new project context"""
+    context = await context_service.create_project_context(
+        name=request.project_metadata.name,
+        description=request.project_metadata.description,
+        technologies=request.project_metadata.technologies,
+        repository_url=request.project_metadata.repository_url
+    )
+    _invalidate_project_responses(context.id, "projects")
+    return ORJSONResponse(_project_context_fields(context))
+
+
+@router.get("/projects/{project_id}", response_model=ProjectContextResponse)
+async def get_project_context(
+    project_id: str,
+    cache_control: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get project context by ID"""
+    key = (project_id,)
+    payload = None if _cache_bypassed(cache_control) else _response_caches["projects"].get(key)
+    if payload is None:
+        generation = _cache_generation
         context = await context_service.get_project_context(project_id)
         if not context:
-            raise HTTPException(status_code=404, detail="Project context not found")
-        return self._project_context_to_response(context)
-
-    @router.get("/projects", response_model=List[ProjectContextResponse])
-    async def list_project_contexts(
-        self,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """List all project contexts"""
+            raise _not_found("Project context not found")
+        payload = _project_context_fields(context)
+        _store_response("projects", key, payload, generation)
+    headers = _validators(payload["last_updated"])
+    if _not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+@router.get("/projects", response_model=List[ProjectContextResponse])
+async def list_project_contexts(
+    cache_control: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """List all project contexts"""
+    key = (None,)
+    payload = None if _cache_bypassed(cache_control) else _response_caches["projects"].get(key)
+    if payload is None:
+        generation = _cache_generation
         contexts = await context_service._context_repo.list_project_contexts()
-        return [self._project_context_to_response(ctx) for ctx in contexts]
-
-    # Domain Context Endpoints
-
-    @router.post("/projects/{project_id}/domains", response_model=DomainContextResponse)
-    async def create_domain_context(
-        self,
-        project_id: str,
-        request: DomainContextCreate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Create domain context for project"""
-        try:
-            domain = await context_service.add_domain_context(
-                project_id=project_id,
-                domain_type=request.domain_type.value,
-                technologies=request.technologies,
-                file_patterns=request.file_patterns,
-                conventions=request.conventions
-            )
-            return self._domain_context_to_response(domain)
-        except Exception as e:
-            logger.error(f"Error creating domain context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.get("/projects/{project_id}/domains", response_model=List[DomainContextResponse])
-    async def get_project_domains(
-        self,
-        project_id: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get all domains for project"""
+        payload = [_project_context_fields(ctx) for ctx in contexts]
+        _store_response("projects", key, payload, generation)
+    headers = _validators(*(ctx["last_updated"] for ctx in payload), count=len(payload))
+    if _not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+# Domain Context Endpoints
+
+@router.post("/projects/{project_id}/domains", response_model=DomainContextResponse)
+async def create_domain_context(
+    project_id: str,
+    request: DomainContextCreate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Create domain context for project"""
+    domain = await context_service.add_domain_context(
+        project_id=project_id,
+        domain_type=request.domain_type,
+        technologies=request.technologies,
+        file_patterns=request.file_patterns,
+        conventions=request.conventions
+    )
+    _invalidate_project_responses(project_id, "domains")
+    return ORJSONResponse(_domain_context_fields(domain))
+
+
+@router.get("/projects/{project_id}/domains", response_model=List[DomainContextResponse])
+async def get_project_domains(
+    project_id: str,
+    cache_control: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get all domains for project"""
+    cache = _response_caches["domains"]
+    key = (project_id, None)
+    payload = None if _cache_bypassed(cache_control) else cache.get(key)
+    if payload is None:
+        generation = _cache_generation
         domains = await context_service._domain_repo.get_domains_by_project(project_id)
-        return [self._domain_context_to_response(domain) for domain in domains]
-
-    @router.get("/projects/{project_id}/domains/{domain_type}", response_model=DomainContextResponse)
-    async def get_domain_by_type(
-        self,
-        project_id: str,
-        domain_type: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get domain by type for project"""
+        payload = [_domain_context_fields(domain) for domain in domains]
+        _store_response("domains", key, payload, generation)
+    headers = _validators(*(domain["last_updated"] for domain in payload), count=len(payload))
+    if _not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+@router.get("/projects/{project_id}/domains/{domain_type}", response_model=DomainContextResponse)
+async def get_domain_by_type(
+    project_id: str,
+    domain_type: str,
+    cache_control: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get domain by type for project"""
+    cache = _response_caches["domains"]
+    key = (project_id, domain_type)
+    payload = None if _cache_bypassed(cache_control) else cache.get(key)
+    if payload is None:
+        generation = _cache_generation
         domain = await context_service._domain_repo.get_domain_by_type(project_id, domain_type)
         if not domain:
-            raise HTTPException(status_code=404, detail="Domain context not found")
-        return self._domain_context_to_response(domain)
-
-    @router.put("/domains/{domain_id}", response_model=DomainContextResponse)
-    async def update_domain_context(
-        self,
-        domain_id: str,
-        request: DomainContextUpdate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Update domain context"""
-        try:
-            # Get existing domain
-            domain = await context_service._domain_repo.get_domain_context(domain_id)
-            if not domain:
-                raise HTTPException(status_code=404, detail="Domain context not found")
-
-            # Update fields
-            if request.technologies is not None:
-                domain.technologies = request.technologies
-            if request.file_patterns is not None:
-                domain.file_patterns = request.file_patterns
-            if request.key_files is not None:
-                domain.key_files = request.key_files
-            if request.conventions is not None:
-                domain.conventions = request.conventions
-
-            updated_domain = await context_service._domain_repo.update_domain_context(domain)
-            return self._domain_context_to_response(updated_domain)
-        except Exception as e:
-            logger.error(f"Error updating domain context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Context Query Endpoints
-
-    @router.post("/projects/{project_id}/query", response_model=ContextQueryResponse)
-    async def query_context(
-        self,
-        project_id: str,
-        request: ContextQueryRequest,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Query project context"""
-        try:
-            domains_filter = [domain.value for domain in request.domains_filter] if request.domains_filter else None
-
-            response = await context_service.query_context(
-                project_id=project_id,
-                query_text=request.query_text,
-                domains_filter=domains_filter,
-                ai_session_id=request.ai_session_id,
-                response_format=request.response_format.value,
-                include_history=request.include_history,
-                max_results=request.max_results
-            )
-            return self._context_response_to_response(response)
-        except Exception as e:
-            logger.error(f"Error querying context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # AI Session Endpoints
-
-    @router.post("/projects/{project_id}/ai-sessions", response_model=AISessionResponse)
-    async def create_ai_session(
-        self,
-        project_id: str,
-        request: AISessionCreate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Create AI session"""
-        try:
-            session = await context_service.start_ai_session(
-                project_id=project_id,
-                ai_type=request.ai_type.value,
-                metadata=request.metadata
-            )
-            return self._ai_session_to_response(session)
-        except Exception as e:
-            logger.error(f"Error creating AI session: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.patch("/ai-sessions/{session_id}/end", response_model=AISessionResponse)
-    async def end_ai_session(
-        self,
-        session_id: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """End AI session"""
-        session = await context_service.end_ai_session(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="AI session not found")
-        return self._ai_session_to_response(session)
-
-    @router.get("/projects/{project_id}/ai-sessions", response_model=List[AISessionResponse])
-    async def get_project_ai_sessions(
-        self,
-        project_id: str,
-        ai_type: Optional[str] = Query(None),
-        active_only: bool = Query(False),
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get AI sessions for project"""
-        if active_only:
-            sessions = await context_service._session_repo.get_active_sessions(project_id)
-        elif ai_type:
-            sessions = await context_service._session_repo.get_sessions_by_ai_type(project_id, ai_type)
-        else:
-            sessions = await context_service._session_repo.get_sessions_by_project(project_id)
-
-        return [self._ai_session_to_response(session) for session in sessions]
-
-    # AI Integration Endpoints
-
-    @router.post("/ai/register", response_model=AICapabilitiesResponse)
-    async def register_ai(
-        self,
-        request: AICapabilitiesRequest,
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Register AI with UCL"""
-        try:
-            from application.ports.ai_adapter_port import AICapabilities
-
-            capabilities = AICapabilities(
-                ai_type=request.ai_type.value,
-                supports_streaming=request.supports_streaming,
-                supports_functions=request.supports_functions,
-                supports_multimodal=request.supports_multimodal,
-                max_context_length=request.max_context_length,
-                preferred_format=request.preferred_format.value,
-                rate_limits=request.rate_limits
-            )
-
-            ai_id = await ai_orchestrator.register_ai(capabilities)
-            return AICapabilitiesResponse(ai_id=ai_id, **request.dict())
-        except Exception as e:
-            logger.error(f"Error registering AI: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.post("/ai/context-request", response_model=ContextQueryResponse)
-    async def handle_ai_context_request(
-        self,
-        project_id: str,
-        request: AIContextRequest,
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Handle context request from AI"""
-        try:
-            from application.ports.ai_adapter_port import AIContextRequest as AIContextRequestPort
-
-            ai_request = AIContextRequestPort(
-                ai_type=request.ai_type.value,
-                ai_instance_id=request.ai_instance_id,
-                query=request.query,
-                domains=[domain.value for domain in request.domains],
-                session_id=request.session_id,
-                max_results=request.max_results,
-                include_history=request.include_history,
-                response_format=request.response_format.value,
-                metadata=request.metadata
-            )
-
-            response = await ai_orchestrator.handle_ai_context_request(ai_request, project_id)
-            return self._context_response_to_response(response)
-        except Exception as e:
-            logger.error(f"Error handling AI context request: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.post("/ai/context-update", response_model=SuccessResponse)
-    async def handle_ai_context_update(
-        self,
-        project_id: str,
-        request: AIContextUpdate,
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Handle context update from AI"""
-        try:
-            from application.ports.ai_adapter_port import AIContextUpdate as AIContextUpdatePort
-            from datetime import datetime
-
-            ai_update = AIContextUpdatePort(
-                ai_type=request.ai_type.value,
-                ai_instance_id=request.ai_instance_id,
-                session_id=request.session_id,
-                domain_type=request.domain_type.value,
-                updates=request.updates,
-                timestamp=datetime.utcnow().isoformat(),
-                metadata=request.metadata
-            )
-
-            success = await ai_orchestrator.handle_ai_context_update(ai_update, project_id)
-            return SuccessResponse(success=success, message="Context updated successfully" if success else "Failed to update context")
-        except Exception as e:
-            logger.error(f"Error handling AI context update: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.post("/ai/subscribe", response_model=AISubscriptionResponse)
-    async def subscribe_ai_to_updates(
-        self,
-        project_id: str,
-        request: AISubscriptionRequest,
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Subscribe AI to context updates"""
-        try:
-            domains = [domain.value for domain in request.domains]
-            subscription_id = await ai_orchestrator.subscribe_ai_to_updates(
-                request.ai_instance_id,
-                project_id,
-                domains
-            )
-
-            from datetime import datetime
-            return AISubscriptionResponse(
-                subscription_id=subscription_id,
-                ai_instance_id=request.ai_instance_id,
-                project_id=project_id,
-                domains=domains,
-                created_at=datetime.utcnow()
-            )
-        except Exception as e:
-            logger.error(f"Error subscribing AI to updates: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Analytics Endpoints
-
-    @router.get("/projects/{project_id}/analytics", response_model=ProjectAnalyticsResponse)
-    async def get_project_analytics(
-        self,
-        project_id: str,
-        days: int = Query(30, ge=1, le=365),
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get project analytics"""
-        try:
-            analytics = await context_service.get_project_analytics(project_id, days)
-            return ProjectAnalyticsResponse(**analytics)
-        except Exception as e:
-            logger.error(f"Error getting project analytics: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.get("/projects/{project_id}/ai-analytics", response_model=AIAnalyticsResponse)
-    async def get_ai_analytics(
-        self,
-        project_id: str,
-        ai_type: Optional[str] = Query(None),
-        days: int = Query(7, ge=1, le=365),
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Get AI analytics"""
-        try:
-            analytics = await ai_orchestrator.get_ai_analytics(project_id, ai_type, days)
-            return AIAnalyticsResponse(**analytics)
-        except Exception as e:
-            logger.error(f"Error getting AI analytics: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.get("/projects/{project_id}/collaboration-insights", response_model=CollaborationInsightsResponse)
-    async def get_collaboration_insights(
-        self,
-        project_id: str,
-        days: int = Query(7, ge=1, le=365),
-        ai_orchestrator: AIOrchestrator = Depends(get_ai_orchestrator)
-    ):
-        """Get collaboration insights"""
-        try:
-            insights = await ai_orchestrator.get_collaboration_insights(project_id, days)
-            return CollaborationInsightsResponse(**insights)
-        except Exception as e:
-            logger.error(f"Error getting collaboration insights: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Helper methods for response conversion
-
-    def _project_context_to_response(self, context) -> ProjectContextResponse:
-        """Convert project context entity to response"""
-        return ProjectContextResponse(
-            id=context.id,
-            project_metadata=context.project_metadata.__dict__,
-            global_context=context.global_context,
-            created_at=context.created_at,
-            last_updated=context.last_updated
-        )
-
-    def _domain_context_to_response(self, domain) -> DomainContextResponse:
-        """Convert domain context entity to response"""
-        return DomainContextResponse(
-            id=domain.id,
-            domain_type=domain.domain_type,
-            technologies=domain.technologies,
-            file_patterns=domain.file_patterns,
-            key_files=domain.key_files,
-            apis=domain.apis,
-            dependencies=domain.dependencies,
-            conventions=domain.conventions,
-            metadata=domain.metadata,
-            last_updated=domain.last_updated
-        )
-
-    def _ai_session_to_response(self, session) -> AISessionResponse:
-        """Convert AI session entity to response"""
-        return AISessionResponse(
-            id=session.id,
-            ai_type=session.ai_type,
-            ai_instance_id=getattr(session, 'ai_instance_id', None),
-            session_start=session.session_start,
-            session_end=session.session_end,
-            domains_accessed=session.domains_accessed,
-            queries_count=session.queries_count,
-            last_query=session.last_query,
-            context_hash=session.context_hash,
-            metadata=session.metadata,
-            is_active=session.session_end is None
-        )
-
-    def _context_response_to_response(self, response) -> ContextQueryResponse:
-        """Convert context response entity to response"""
-        return ContextQueryResponse(
-            query_id=response.query_id,
-            results=response.results,
-            domains_found=response.domains_found,
-            total_results=response.total_results,
-            processing_time_ms=response.processing_time_ms,
-            metadata=response.metadata,
-            timestamp=response.timestamp
-        )
-
-    # Global Context Endpoints
-
-    @router.get("/projects/{project_id}/global-context", response_model=GlobalContextResponse)
-    async def get_global_context(
-        self,
-        project_id: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get global context for project"""
+            raise _not_found("Domain context not found")
+        payload = _domain_context_fields(domain)
+        _store_response("domains", key, payload, generation)
+    headers = _validators(payload["last_updated"])
+    if _not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+@router.put("/domains/{domain_id}", response_model=DomainContextResponse)
+async def update_domain_context(
+    domain_id: str,
+    request: DomainContextUpdate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Update domain context"""
+    # Get existing domain
+    domain = await context_service._domain_repo.get_domain_context(domain_id)
+    if not domain:
+        raise _not_found("Domain context not found")
+
+    # Update fields
+    if request.technologies is not None:
+        domain.technologies = request.technologies
+    if request.file_patterns is not None:
+        domain.file_patterns = request.file_patterns
+    if request.key_files is not None:
+        domain.key_files = request.key_files
+    if request.conventions is not None:
+        domain.conventions = request.conventions
+
+    updated_domain = await context_service._domain_repo.update_domain_context(domain)
+    # Domains do not carry their project id, so drop every cached domain read
+    _clear_responses("domains")
+    return ORJSONResponse(_domain_context_fields(updated_domain))
+
+
+# Context Query Endpoints
+
+@router.post("/projects/{project_id}/query", response_model=ContextQueryResponse,
+             openapi_extra=_json_body_openapi(ContextQueryRequest))
+async def query_context(
+    project_id: str,
+    request: ContextQueryRequest = Depends(_json_body(ContextQueryRequest)),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Query project context"""
+    response = await context_service.query_context(
+        project_id=project_id,
+        query_text=request.query_text,
+        domains_filter=request.domains_filter or None,
+        ai_session_id=request.ai_session_id,
+        response_format=request.response_format,
+        include_history=request.include_history,
+        max_results=request.max_results
+    )
+    return _context_query_response(response)
+
+
+# AI Session Endpoints
+
+@router.post("/projects/{project_id}/ai-sessions", response_model=AISessionResponse)
+async def create_ai_session(
+    project_id: str,
+    request: AISessionCreate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Create AI session"""
+    session = await context_service.start_ai_session(
+        project_id=project_id,
+        ai_type=request.ai_type,
+        metadata=request.metadata
+    )
+    return ORJSONResponse(_ai_session_fields(session))
+
+
+@router.patch("/ai-sessions/{session_id}/end", response_model=AISessionResponse)
+async def end_ai_session(
+    session_id: str,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """End AI session"""
+    session = await context_service.end_ai_session(session_id)
+    if not session:
+        raise _not_found("AI session not found")
+    return ORJSONResponse(_ai_session_fields(session))
+
+
+@router.get("/projects/{project_id}/ai-sessions", response_model=List[AISessionResponse])
+async def get_project_ai_sessions(
+    project_id: str,
+    ai_type: Optional[str] = Query(None),
+    active_only: bool = Query(False),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get AI sessions for project"""
+    if active_only:
+        sessions = await context_service._session_repo.get_active_sessions(project_id)
+    elif ai_type:
+        sessions = await context_service._session_repo.get_sessions_by_ai_type(project_id, ai_type)
+    else:
+        sessions = await context_service._session_repo.get_sessions_by_project(project_id)
+
+    return ORJSONResponse([_ai_session_fields(session) for session in sessions])
+
+
+# AI Integration Endpoints
+
+@router.post("/ai/register", response_model=AICapabilitiesResponse)
+async def register_ai(
+    request: AICapabilitiesRequest,
+    force: bool = Query(False),
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Register AI with UCL"""
+    capabilities = AICapabilities(
+        ai_type=request.ai_type,
+        supports_streaming=request.supports_streaming,
+        supports_functions=request.supports_functions,
+        supports_multimodal=request.supports_multimodal,
+        max_context_length=request.max_context_length,
+        preferred_format=request.preferred_format,
+        rate_limits=request.rate_limits
+    )
+
+    ai_id = await ai_orchestrator.register_ai(capabilities, request.ai_instance_id, force)
+    return ORJSONResponse({"ai_id": ai_id, **request.model_dump()})
+
+
+@router.post("/ai/context-request", response_model=ContextQueryResponse,
+             openapi_extra=_json_body_openapi(AIContextRequest))
+async def handle_ai_context_request(
+    project_id: str,
+    request: AIContextRequest = Depends(_json_body(AIContextRequest)),
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Handle context request from AI"""
+    ai_request = AIContextRequestPort(
+        ai_type=request.ai_type,
+        ai_instance_id=request.ai_instance_id,
+        query=request.query,
+        domains=request.domains,
+        session_id=request.session_id,
+        max_results=request.max_results,
+        include_history=request.include_history,
+        response_format=request.response_format,
+        metadata=request.metadata
+    )
+
+    response = await ai_orchestrator.handle_ai_context_request(ai_request, project_id)
+    return _context_query_response(response)
+
+
+async def _apply_ai_context_update(
+    ai_orchestrator: AIOrchestrator,
+    ai_update: AIContextUpdatePort,
+    project_id: str,
+    session: AISession
+) -> None:
+    """Apply an accepted AI context update off the request path"""
+    try:
+        success = await ai_orchestrator.apply_ai_context_update(ai_update, project_id, session)
+    except Exception as e:
+        logger.error("Error applying AI context update: %s", e)
+        ai_orchestrator.record_failed_update(ai_update, project_id, str(e))
+        return
+    if not success:
+        logger.warning("AI context update for project %s partially failed", project_id)
+    _invalidate_project_responses(project_id)
+
+
+@router.post("/ai/context-update", response_model=SuccessResponse, status_code=202,
+             openapi_extra=_json_body_openapi(AIContextUpdate))
+async def handle_ai_context_update(
+    project_id: str,
+    background_tasks: BackgroundTasks,
+    request: AIContextUpdate = Depends(_json_body(AIContextUpdate)),
+    idempotency_key: Optional[str] = Header(None),
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Handle context update from AI"""
+    accepted_key = (project_id, idempotency_key)
+    if idempotency_key:
+        if accepted_key in _accepted_ai_updates:
+            return SuccessResponse(success=True, message="Context update already accepted")
+        # Claimed before validation awaits, so a concurrent retry is not queued twice
+        _accepted_ai_updates[accepted_key] = True
+
+    ai_update = AIContextUpdatePort(
+        ai_type=request.ai_type,
+        ai_instance_id=request.ai_instance_id,
+        session_id=request.session_id,
+        domain_type=request.domain_type,
+        updates=request.updates,
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        metadata=request.metadata
+    )
+
+    # Rejections (rate limit, unknown session or project) are reported before the 202
+    try:
+        session = await ai_orchestrator.validate_ai_context_update(ai_update, project_id)
+    except Exception:
+        _accepted_ai_updates.pop(accepted_key, None)
+        raise
+
+    background_tasks.add_task(_apply_ai_context_update, ai_orchestrator, ai_update, project_id, session)
+    return SuccessResponse(success=True, message="Context update accepted")
+
+
+@router.get("/ai/context-update/failures", response_model=List[Dict[str, Any]])
+async def get_failed_ai_context_updates(
+    project_id: str,
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """List accepted AI context updates that failed to apply"""
+    return ORJSONResponse(ai_orchestrator.get_failed_updates(project_id))
+
+
+@router.post("/ai/subscribe", response_model=AISubscriptionResponse)
+async def subscribe_ai_to_updates(
+    project_id: str,
+    request: AISubscriptionRequest,
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Subscribe AI to context updates"""
+    domains = request.domains
+    subscription_id = await ai_orchestrator.subscribe_ai_to_updates(
+        request.ai_instance_id,
+        project_id,
+        domains
+    )
+
+    return ORJSONResponse({
+        "subscription_id": subscription_id,
+        "ai_instance_id": request.ai_instance_id,
+        "project_id": project_id,
+        "domains": domains,
+        "created_at": datetime.now(timezone.utc)
+    })
+
+
+# Analytics Endpoints
+
+@router.get("/projects/{project_id}/analytics", response_model=ProjectAnalyticsResponse)
+async def get_project_analytics(
+    project_id: str,
+    days: int = Query(30, ge=1, le=365),
+    cache_control: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get project analytics"""
+    cache = _response_caches["project_analytics"]
+    key = (project_id, days)
+    if not _cache_bypassed(cache_control) and key in cache:
+        return ORJSONResponse(cache[key])
+    cache[key] = analytics = await context_service.get_project_analytics(project_id, days)
+    return ORJSONResponse(analytics)
+
+
+async def _refresh_project_analytics(
+    context_service: ContextService,
+    project_id: str,
+    days: int
+) -> None:
+    """Recompute a project analytics snapshot into the response cache"""
+    try:
+        analytics = await context_service.get_project_analytics(project_id, days)
+    except Exception as e:
+        logger.error("Error refreshing project analytics: %s", e)
+        return
+    _response_caches["project_analytics"][(project_id, days)] = analytics
+
+
+@router.post("/projects/{project_id}/analytics/refresh", response_model=SuccessResponse, status_code=202)
+async def refresh_project_analytics(
+    project_id: str,
+    background_tasks: BackgroundTasks,
+    days: int = Query(30, ge=1, le=365),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Schedule a project analytics recompute"""
+    background_tasks.add_task(_refresh_project_analytics, context_service, project_id, days)
+    return SuccessResponse(success=True, message="Analytics refresh scheduled")
+
+
+@router.get("/projects/{project_id}/ai-analytics", response_model=AIAnalyticsResponse)
+async def get_ai_analytics(
+    project_id: str,
+    ai_type: Optional[str] = Query(None),
+    days: int = Query(7, ge=1, le=365),
+    cache_control: Optional[str] = Header(None),
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Get AI analytics"""
+    cache = _response_caches["ai_analytics"]
+    key = (project_id, "ai", ai_type, days)
+    if not _cache_bypassed(cache_control) and key in cache:
+        return ORJSONResponse(cache[key])
+    cache[key] = analytics = await ai_orchestrator.get_ai_analytics(project_id, ai_type, days)
+    return ORJSONResponse(analytics)
+
+
+@router.get("/projects/{project_id}/collaboration-insights", response_model=CollaborationInsightsResponse)
+async def get_collaboration_insights(
+    project_id: str,
+    days: int = Query(7, ge=1, le=365),
+    cache_control: Optional[str] = Header(None),
+    ai_orchestrator: AIOrchestrator = Depends(provide_ai_orchestrator)
+):
+    """Get collaboration insights"""
+    cache = _response_caches["ai_analytics"]
+    key = (project_id, "collaboration", days)
+    if not _cache_bypassed(cache_control) and key in cache:
+        return ORJSONResponse(cache[key])
+    cache[key] = insights = await ai_orchestrator.get_collaboration_insights(project_id, days)
+    return ORJSONResponse(insights)
+
+
+# Helper functions for response conversion
+# Entities come from our own repositories and were validated at ingress, so
+# routes return these plain field dicts through ORJSONResponse. Returning a
+# Response skips FastAPI's response_model validation and jsonable_encoder;
+# response_model stays on the decorators for the OpenAPI schema only.
+
+def _project_context_fields(context) -> Dict[str, Any]:
+    """Project context response fields as a JSON-ready dict"""
+    return {
+        "id": context.id,
+        "project_metadata": context.project_metadata.to_dict(),
+        "global_context": context.global_context,
+        "created_at": context.created_at,
+        "last_updated": context.last_updated
+    }
+
+
+def _domain_context_fields(domain) -> Dict[str, Any]:
+    """Domain context response fields as a JSON-ready dict"""
+    return {
+        "id": domain.id,
+        "domain_type": domain.domain_type,
+        "technologies": domain.technologies,
+        "file_patterns": domain.file_patterns,
+        "key_files": domain.key_files,
+        "apis": domain.apis,
+        "dependencies": domain.dependencies,
+        "conventions": domain.conventions,
+        "metadata": domain.metadata,
+        "last_updated": domain.last_updated
+    }
+
+
+def _ai_session_fields(session) -> Dict[str, Any]:
+    """AI session response fields as a JSON-ready dict"""
+    return {
+        "id": session.id,
+        "ai_type": session.ai_type,
+        "ai_instance_id": getattr(session, 'ai_instance_id', None),
+        "session_start": session.session_start,
+        "session_end": session.session_end,
+        "domains_accessed": session.domains_accessed,
+        "queries_count": session.queries_count,
+        "last_query": session.last_query,
+        "context_hash": session.context_hash,
+        "metadata": session.metadata,
+        "is_active": session.session_end is None
+    }
+
+
+def _context_response_fields(response) -> Dict[str, Any]:
+    """Context query response fields as a JSON-ready dict"""
+    return {
+        "query_id": response.query_id,
+        "results": response.results,
+        "domains_found": response.domains_found,
+        "total_results": response.total_results,
+        "processing_time_ms": response.processing_time_ms,
+        "metadata": response.metadata,
+        "timestamp": response.timestamp
+    }
+
+
+# Query responses with at least this many results are streamed in batches
+_STREAM_MIN_RESULTS = 256
+_STREAM_BATCH_SIZE = 128
+
+
+async def _stream_context_response(fields: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """Encode a context query response with its results one batch at a time"""
+    results = fields.pop("results")
+    yield orjson.dumps(fields, option=orjson.OPT_NON_STR_KEYS)[:-1] + b',"results":['
+    for start in range(0, len(results), _STREAM_BATCH_SIZE):
+        batch = orjson.dumps(
+            results[start:start + _STREAM_BATCH_SIZE], option=orjson.OPT_NON_STR_KEYS
+        )[1:-1]
+        yield b"," + batch if start else batch
+    yield b"]}"
+
+
+def _context_query_response(response) -> Response:
+    """Return a context query response, streaming large result sets"""
+    fields = _context_response_fields(response)
+    if len(fields["results"]) < _STREAM_MIN_RESULTS:
+        return ORJSONResponse(fields)
+    return StreamingResponse(_stream_context_response(fields), media_type="application/json")
+
+
+# Global Context Endpoints
+
+@router.get("/projects/{project_id}/global-context", response_model=GlobalContextResponse)
+async def get_global_context(
+    project_id: str,
+    cache_control: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get global context for project"""
+    key = (project_id,)
+    payload = None if _cache_bypassed(cache_control) else _response_caches["global_context"].get(key)
+    if payload is None:
+        generation = _cache_generation
         global_context = await context_service.get_global_context(project_id)
         if not global_context:
-            raise HTTPException(status_code=404, detail="Global context not found")
-        return self._global_context_to_response(global_context)
-
-    @router.put("/projects/{project_id}/global-context", response_model=GlobalContextResponse)
-    async def update_global_context(
-        self,
-        project_id: str,
-        request: GlobalContextUpdate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Update global context"""
-        try:
-            updated_context = await context_service.update_global_context(
-                project_id=project_id,
-                shared_knowledge=request.shared_knowledge,
-                shared_conventions=request.shared_conventions,
-                common_patterns=request.common_patterns
-            )
-            if not updated_context:
-                raise HTTPException(status_code=404, detail="Global context not found")
-            return self._global_context_to_response(updated_context)
-        except Exception as e:
-            logger.error(f"Error updating global context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.post("/projects/{project_id}/global-context/merge-insights", response_model=SuccessResponse)
-    async def merge_insights_to_global(
-        self,
-        project_id: str,
-        request: MergeInsightsRequest,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Merge insights from platform to global context"""
-        try:
-            success = await context_service.merge_platform_insights_to_global(
-                project_id=project_id,
-                insights=request.insights,
-                source_platform=request.source_platform.value
-            )
-            return SuccessResponse(
-                success=success,
-                message="Insights merged successfully" if success else "Failed to merge insights"
-            )
-        except Exception as e:
-            logger.error(f"Error merging insights: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Platform Context Endpoints
-
-    @router.post("/projects/{project_id}/platform-contexts", response_model=PlatformContextResponse)
-    async def create_platform_context(
-        self,
-        project_id: str,
-        request: PlatformContextCreate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Create platform-specific context"""
-        try:
-            platform_context = await context_service.create_platform_context(
-                project_id=project_id,
-                platform_type=request.platform_type.value,
-                metadata={
-                    "platform_specific_data": request.platform_specific_data,
-                    "learned_preferences": request.learned_preferences,
-                    "custom_prompts": request.custom_prompts,
-                    "platform_conventions": request.platform_conventions
-                }
-            )
-            return self._platform_context_to_response(platform_context)
-        except Exception as e:
-            logger.error(f"Error creating platform context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.get("/projects/{project_id}/platform-contexts", response_model=List[PlatformContextResponse])
-    async def get_platform_contexts(
-        self,
-        project_id: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get all platform contexts for project"""
+            raise _not_found("Global context not found")
+        payload = _global_context_fields(global_context)
+        _store_response("global_context", key, payload, generation)
+    return ORJSONResponse(payload)
+
+
+@router.put("/projects/{project_id}/global-context", response_model=GlobalContextResponse)
+async def update_global_context(
+    project_id: str,
+    request: GlobalContextUpdate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Update global context"""
+    updated_context = await context_service.update_global_context(
+        project_id=project_id,
+        shared_knowledge=request.shared_knowledge,
+        shared_conventions=request.shared_conventions,
+        common_patterns=request.common_patterns
+    )
+    _invalidate_project_responses(project_id, "global_context")
+    if not updated_context:
+        raise _not_found("Global context not found")
+    return ORJSONResponse(_global_context_fields(updated_context))
+
+
+@router.post("/projects/{project_id}/global-context/merge-insights", response_model=SuccessResponse)
+async def merge_insights_to_global(
+    project_id: str,
+    request: MergeInsightsRequest,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Merge insights from platform to global context"""
+    success = await context_service.merge_platform_insights_to_global(
+        project_id=project_id,
+        insights=request.insights,
+        source_platform=request.source_platform
+    )
+    _invalidate_project_responses(project_id, "global_context")
+    return SuccessResponse(
+        success=success,
+        message="Insights merged successfully" if success else "Failed to merge insights"
+    )
+
+
+# Platform Context Endpoints
+
+@router.post("/projects/{project_id}/platform-contexts", response_model=PlatformContextResponse)
+async def create_platform_context(
+    project_id: str,
+    request: PlatformContextCreate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Create platform-specific context"""
+    platform_context = await context_service.create_platform_context(
+        project_id=project_id,
+        platform_type=request.platform_type,
+        metadata={
+            "platform_specific_data": request.platform_specific_data,
+            "learned_preferences": request.learned_preferences,
+            "custom_prompts": request.custom_prompts,
+            "platform_conventions": request.platform_conventions
+        }
+    )
+    # Creation also touches the project's last_updated
+    _invalidate_project_responses(project_id, "platform_contexts", "projects")
+    return ORJSONResponse(_platform_context_fields(platform_context))
+
+
+@router.get("/projects/{project_id}/platform-contexts", response_model=List[PlatformContextResponse])
+async def get_platform_contexts(
+    project_id: str,
+    cache_control: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get all platform contexts for project"""
+    key = (project_id, None)
+    payload = None if _cache_bypassed(cache_control) else _response_caches["platform_contexts"].get(key)
+    if payload is None:
+        generation = _cache_generation
         contexts = await context_service.get_platform_contexts_for_project(project_id)
-        return [self._platform_context_to_response(ctx) for ctx in contexts]
-
-    @router.get("/projects/{project_id}/platform-contexts/{platform_type}", response_model=PlatformContextResponse)
-    async def get_platform_context_by_type(
-        self,
-        project_id: str,
-        platform_type: str,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Get platform context by type"""
-        context = await context_service.get_platform_context(project_id, platform_type)
-        if not context:
-            raise HTTPException(status_code=404, detail="Platform context not found")
-        return self._platform_context_to_response(context)
-
-    @router.put("/platform-contexts/{context_id}", response_model=PlatformContextResponse)
-    async def update_platform_context(
-        self,
-        context_id: str,
-        request: PlatformContextUpdate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Update platform context"""
-        try:
-            updated_context = await context_service.update_platform_context(
-                context_id=context_id,
-                learned_preferences=request.learned_preferences,
-                custom_prompts=request.custom_prompts,
-                platform_conventions=request.platform_conventions
-            )
-            if not updated_context:
-                raise HTTPException(status_code=404, detail="Platform context not found")
-            return self._platform_context_to_response(updated_context)
-        except Exception as e:
-            logger.error(f"Error updating platform context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    @router.post("/platform-contexts/{context_id}/interactions", response_model=SuccessResponse)
-    async def add_interaction(
-        self,
-        context_id: str,
-        request: InteractionCreate,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Add interaction to platform context history"""
-        try:
-            interaction = {
-                "type": request.interaction_type,
-                "content": request.content,
-                "metadata": request.metadata
-            }
-            success = await context_service.add_interaction_to_platform_history(
-                context_id, interaction
-            )
-            return SuccessResponse(
-                success=success,
-                message="Interaction added successfully" if success else "Failed to add interaction"
-            )
-        except Exception as e:
-            logger.error(f"Error adding interaction: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Hierarchical Query Endpoint
-
-    @router.post("/projects/{project_id}/query-hierarchy", response_model=ContextQueryResponse)
-    async def query_context_with_hierarchy(
-        self,
-        project_id: str,
-        request: ContextQueryWithHierarchy,
-        context_service: ContextService = Depends(get_context_service)
-    ):
-        """Query context with global and platform hierarchy"""
-        try:
-            domains_filter = [domain.value for domain in request.domains_filter] if request.domains_filter else None
-
-            response = await context_service.query_context_with_hierarchy(
-                project_id=project_id,
-                platform_type=request.platform_type.value,
-                query_text=request.query_text,
-                include_global=request.include_global,
-                include_platform=request.include_platform,
-                domains_filter=domains_filter,
-                max_results=request.max_results
-            )
-            return self._context_response_to_response(response)
-        except Exception as e:
-            logger.error(f"Error querying hierarchical context: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-    # Helper methods for new response conversion
-
-    def _global_context_to_response(self, context) -> GlobalContextResponse:
-        """Convert global context entity to response"""
-        return GlobalContextResponse(
-            id=context.id,
-            project_id=context.project_id,
-            shared_knowledge=context.shared_knowledge,
-            shared_conventions=context.shared_conventions,
-            shared_resources=context.shared_resources,
-            common_patterns=context.common_patterns,
-            cross_platform_insights=context.cross_platform_insights,
-            last_updated=context.last_updated,
-            version=context.version
-        )
-
-    def _platform_context_to_response(self, context) -> PlatformContextResponse:
-        """Convert platform context entity to response"""
-        return PlatformContextResponse(
-            id=context.id,
-            platform_type=context.platform_type,
-            project_id=context.project_id,
-            global_context_id=context.global_context_id,
-            platform_specific_data=context.platform_specific_data,
-            learned_preferences=context.learned_preferences,
-            interaction_history=context.interaction_history,
-            custom_prompts=context.custom_prompts,
-            platform_conventions=context.platform_conventions,
-            performance_metrics=context.performance_metrics,
-            last_updated=context.last_updated,
-            version=context.version
-        )
+        payload = [_platform_context_fields(ctx) for ctx in contexts]
+        _store_response("platform_contexts", key, payload, generation)
+    headers = _validators(*(ctx["last_updated"] for ctx in payload), count=len(payload))
+    if _not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+@router.get("/projects/{project_id}/platform-contexts/{platform_type}", response_model=PlatformContextResponse)
+async def get_platform_context_by_type(
+    project_id: str,
+    platform_type: str,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Get platform context by type"""
+    context = await context_service.get_platform_context(project_id, platform_type)
+    if not context:
+        raise _not_found("Platform context not found")
+    return ORJSONResponse(_platform_context_fields(context))
+
+
+@router.put("/platform-contexts/{context_id}", response_model=PlatformContextResponse)
+async def update_platform_context(
+    context_id: str,
+    request: PlatformContextUpdate,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Update platform context"""
+    updated_context = await context_service.update_platform_context(
+        context_id=context_id,
+        learned_preferences=request.learned_preferences,
+        custom_prompts=request.custom_prompts,
+        platform_conventions=request.platform_conventions
+    )
+    if not updated_context:
+        raise _not_found("Platform context not found")
+    _invalidate_project_responses(updated_context.project_id, "platform_contexts")
+    return ORJSONResponse(_platform_context_fields(updated_context))
+
+
+@router.post("/platform-contexts/{context_id}/interactions", response_model=SuccessResponse,
+             openapi_extra=_json_body_openapi(InteractionCreate))
+async def add_interaction(
+    context_id: str,
+    request: InteractionCreate = Depends(_json_body(InteractionCreate)),
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Add interaction to platform context history"""
+    interaction = {
+        "type": request.interaction_type,
+        "content": request.content,
+        "metadata": request.metadata
+    }
+    success = await context_service.add_interaction_to_platform_history(
+        context_id, interaction
+    )
+    # Only the context id is known here, so drop every cached platform read
+    _clear_responses("platform_contexts")
+    return SuccessResponse(
+        success=success,
+        message="Interaction added successfully" if success else "Failed to add interaction"
+    )
+
+
+# Hierarchical Query Endpoint
+
+@router.post("/projects/{project_id}/query-hierarchy", response_model=ContextQueryResponse)
+async def query_context_with_hierarchy(
+    project_id: str,
+    request: ContextQueryWithHierarchy,
+    context_service: ContextService = Depends(provide_context_service)
+):
+    """Query context with global and platform hierarchy"""
+    response = await context_service.query_context_with_hierarchy(
+        project_id=project_id,
+        platform_type=request.platform_type,
+        query_text=request.query_text,
+        include_global=request.include_global,
+        include_platform=request.include_platform,
+        domains_filter=request.domains_filter or None,
+        max_results=request.max_results
+    )
+    return _context_query_response(response)
+
+
+# Helper functions for new response conversion
+
+def _global_context_fields(context) -> Dict[str, Any]:
+    """Global context response fields as a JSON-ready dict"""
+    return {
+        "id": context.id,
+        "project_id": context.project_id,
+        "shared_knowledge": context.shared_knowledge,
+        "shared_conventions": context.shared_conventions,
+        "shared_resources": context.shared_resources,
+        "common_patterns": context.common_patterns,
+        "cross_platform_insights": context.cross_platform_insights,
+        "last_updated": context.last_updated,
+        "version": context.version
+    }
+
+
+def _platform_context_fields(context) -> Dict[str, Any]:
+    """Platform context response fields as a JSON-ready dict"""
+    return {
+        "id": context.id,
+        "platform_type": context.platform_type,
+        "project_id": context.project_id,
+        "global_context_id": context.global_context_id,
+        "platform_specific_data": context.platform_specific_data,
+        "learned_preferences": context.learned_preferences,
+        "interaction_history": context.interaction_history,
+        "custom_prompts": context.custom_prompts,
+        "platform_conventions": context.platform_conventions,
+        "performance_metrics": context.performance_metrics,
+        "last_updated": context.last_updated,
+        "version": context.version
+    }
+
 
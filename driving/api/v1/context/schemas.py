@@ -1,144 +1,159 @@
 """Pydantic schemas for UCL API"""
-from pydantic import BaseModel, Field, HttpUrl
-from typing import List, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, WithJsonSchema
+from typing import Annotated, List, Literal, Optional, Dict, Any
 from datetime import datetime
-from enum import Enum
-
-
-class DomainType(str, Enum):
-    """Domain types for context"""
-    FRONTEND = "frontend"
-    BACKEND = "backend"
-    DESIGN = "design"
-    INFRASTRUCTURE = "infrastructure"
-    TESTING = "testing"
-    DOCUMENTATION = "documentation"
-    DATA = "data"
-    MOBILE = "mobile"
-    DESKTOP = "desktop"
-    API = "api"
-    DATABASE = "database"
-    SECURITY = "security"
-    DEVOPS = "devops"
-    ANALYTICS = "analytics"
-    OTHER = "other"
-
-
-class AIType(str, Enum):
-    """AI types"""
-    CLAUDE = "claude"
-    CHATGPT = "chatgpt"
-    COPILOT = "copilot"
-    BARD = "bard"
-    CUSTOM = "custom"
-    OTHER = "other"
-
-
-class ResponseFormat(str, Enum):
-    """Response formats"""
-    STRUCTURED = "structured"
-    MARKDOWN = "markdown"
-    JSON = "json"
-    TEXT = "text"
-
-
-class ContextScope(str, Enum):
-    """Context scope types"""
-    GLOBAL = "global"
-    PLATFORM = "platform"
-    DOMAIN = "domain"
-    ALL = "all"
+
+
+# Enumerated Types
+# Literal unions validate through pydantic-core's literal lookup and arrive as plain str
+
+# Domain types for context
+DomainType = Literal[
+    "frontend", "backend", "design", "infrastructure", "testing",
+    "documentation", "data", "mobile", "desktop", "api",
+    "database", "security", "devops", "analytics", "other",
+]
+
+# AI types
+AIType = Literal["claude", "chatgpt", "copilot", "bard", "custom", "other"]
+
+# Response formats
+ResponseFormat = Literal["structured", "markdown", "json", "text"]
+
+# Context scope types
+ContextScope = Literal["global", "platform", "domain", "all"]
+
+
+# URLs stay plain strings, checked by a compiled scheme pattern instead of a full parse
+UrlStr = Annotated[str, StringConstraints(max_length=2048, pattern=r"^https?://")]
+
+
+# Shared constraints for the query request schemas
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+MaxResults = Annotated[int, Field(ge=1, le=1000)]
+
+
+def _require_object(value: Any) -> Any:
+    """Reject JSON values that are not objects"""
+    if not isinstance(value, dict):
+        raise ValueError("must be a JSON object")
+    return value
+
+
+# Free-form JSON objects are passed through as-is: a single isinstance check
+# instead of validating every key, and no copy of the dict
+JSONObj = Annotated[Any, AfterValidator(_require_object), WithJsonSchema({"type": "object"})]
+
+
+def _require_array(value: Any) -> Any:
+    """Reject JSON values that are not arrays"""
+    if not isinstance(value, list):
+        raise ValueError("must be a JSON array")
+    return value
+
+
+# Lists of free-form objects: the list itself is checked once, its items are opaque
+JSONObjList = Annotated[
+    Any,
+    AfterValidator(_require_array),
+    WithJsonSchema({"type": "array", "items": {"type": "object"}}),
+]
+
+
+class UCLSchema(BaseModel):
+    """Base for UCL API schemas"""
+    # Core schemas are built on first use rather than at import; unknown keys are dropped
+    model_config = ConfigDict(defer_build=True, extra="ignore")
 
 
 # Project Context Schemas
 
-class ProjectMetadataCreate(BaseModel):
+class ProjectMetadataCreate(UCLSchema):
     """Schema for creating project metadata"""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     version: Optional[str] = None
-    repository_url: Optional[HttpUrl] = None
+    repository_url: Optional[UrlStr] = None
     technologies: List[str] = Field(default_factory=list)
     team_members: List[str] = Field(default_factory=list)
-    documentation_urls: List[HttpUrl] = Field(default_factory=list)
+    documentation_urls: List[UrlStr] = Field(default_factory=list)
 
 
-class ProjectMetadataResponse(ProjectMetadataCreate):
-    """Schema for project metadata response"""
-    pass
+# Same shape as the create schema; an alias avoids building a second core schema
+ProjectMetadataResponse = ProjectMetadataCreate
 
 
-class ProjectContextCreate(BaseModel):
+class ProjectContextCreate(UCLSchema):
     """Schema for creating project context"""
     project_metadata: ProjectMetadataCreate
-    global_context: Dict[str, Any] = Field(default_factory=dict)
+    global_context: JSONObj = Field(default_factory=dict)
 
 
-class ProjectContextResponse(BaseModel):
+class ProjectContextResponse(UCLSchema):
     """Schema for project context response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     project_metadata: ProjectMetadataResponse
-    global_context: Dict[str, Any]
+    global_context: JSONObj
     created_at: datetime
     last_updated: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Domain Context Schemas
 
-class DomainContextCreate(BaseModel):
+class DomainContextCreate(UCLSchema):
     """Schema for creating domain context"""
     domain_type: DomainType
     technologies: List[str] = Field(default_factory=list)
     file_patterns: List[str] = Field(default_factory=list)
     key_files: List[str] = Field(default_factory=list)
-    apis: List[Dict[str, Any]] = Field(default_factory=list)
+    apis: JSONObjList = Field(default_factory=list)
     dependencies: List[str] = Field(default_factory=list)
-    conventions: Dict[str, Any] = Field(default_factory=dict)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    conventions: JSONObj = Field(default_factory=dict)
+    metadata: JSONObj = Field(default_factory=dict)
 
 
-class DomainContextUpdate(BaseModel):
+class DomainContextUpdate(UCLSchema):
     """Schema for updating domain context"""
     technologies: Optional[List[str]] = None
     file_patterns: Optional[List[str]] = None
     key_files: Optional[List[str]] = None
-    apis: Optional[List[Dict[str, Any]]] = None
+    apis: Optional[JSONObjList] = None
     dependencies: Optional[List[str]] = None
-    conventions: Optional[Dict[str, Any]] = None
-    metadata: Optional[Dict[str, Any]] = None
+    conventions: Optional[JSONObj] = None
+    metadata: Optional[JSONObj] = None
 
 
-class DomainContextResponse(BaseModel):
+class DomainContextResponse(UCLSchema):
     """Schema for domain context response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     domain_type: str
     technologies: List[str]
     file_patterns: List[str]
     key_files: List[str]
-    apis: List[Dict[str, Any]]
+    apis: JSONObjList
     dependencies: List[str]
-    conventions: Dict[str, Any]
-    metadata: Dict[str, Any]
+    conventions: JSONObj
+    metadata: JSONObj
     last_updated: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # AI Session Schemas
 
-class AISessionCreate(BaseModel):
+class AISessionCreate(UCLSchema):
     """Schema for creating AI session"""
     ai_type: AIType
     ai_instance_id: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: JSONObj = Field(default_factory=dict)
 
 
-class AISessionResponse(BaseModel):
+class AISessionResponse(UCLSchema):
     """Schema for AI session response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     ai_type: str
     ai_instance_id: Optional[str]
@@ -148,63 +163,68 @@ class AISessionResponse(BaseModel):
     queries_count: int
     last_query: Optional[str]
     context_hash: Optional[str]
-    metadata: Dict[str, Any]
+    metadata: JSONObj
     is_active: bool
 
-    class Config:
-        from_attributes = True
-
 
 # Context Query Schemas
 
-class ContextQueryRequest(BaseModel):
+class ContextQueryRequest(UCLSchema):
     """Schema for context query request"""
-    query_text: str = Field(..., min_length=1)
+    query_text: NonEmptyStr
     domains_filter: List[DomainType] = Field(default_factory=list)
     ai_session_id: Optional[str] = None
-    response_format: ResponseFormat = ResponseFormat.STRUCTURED
+    response_format: ResponseFormat = "structured"
     include_history: bool = False
-    max_results: int = Field(default=100, ge=1, le=1000)
+    max_results: MaxResults = 100
 
 
-class ContextQueryResponse(BaseModel):
+class ContextQueryResponse(UCLSchema):
     """Schema for context query response"""
+    model_config = ConfigDict(from_attributes=True)
+
     query_id: str
-    results: List[Dict[str, Any]]
+    results: JSONObjList
     domains_found: List[str]
     total_results: int
     processing_time_ms: float
-    metadata: Dict[str, Any]
+    metadata: JSONObj
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # AI Context Schemas
 
-class AIContextRequest(BaseModel):
+class AIContextRequest(UCLSchema):
     """Schema for AI context request"""
     ai_type: AIType
     ai_instance_id: str
-    query: str = Field(..., min_length=1)
+    query: NonEmptyStr
     domains: List[DomainType] = Field(default_factory=list)
     session_id: Optional[str] = None
-    max_results: int = Field(default=100, ge=1, le=1000)
+    max_results: MaxResults = 100
     include_history: bool = False
-    response_format: ResponseFormat = ResponseFormat.STRUCTURED
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    response_format: ResponseFormat = "structured"
+    metadata: JSONObj = Field(default_factory=dict)
+
 
+_DEFAULT_RATE_LIMITS = (("requests_per_minute", 60),)
 
-class AICapabilitiesRequest(BaseModel):
+
+def _default_rate_limits() -> Dict[str, int]:
+    """Fresh copy of the default AI rate limits"""
+    return dict(_DEFAULT_RATE_LIMITS)
+
+
+class AICapabilitiesRequest(UCLSchema):
     """Schema for AI capabilities registration"""
     ai_type: AIType
+    ai_instance_id: Optional[str] = None
     supports_streaming: bool = False
     supports_functions: bool = False
     supports_multimodal: bool = False
     max_context_length: int = Field(default=4096, ge=1)
-    preferred_format: ResponseFormat = ResponseFormat.MARKDOWN
-    rate_limits: Dict[str, int] = Field(default_factory=lambda: {"requests_per_minute": 60})
+    preferred_format: ResponseFormat = "markdown"
+    rate_limits: Dict[str, int] = Field(default_factory=_default_rate_limits)
 
 
 class AICapabilitiesResponse(AICapabilitiesRequest):
@@ -212,23 +232,24 @@ class AICapabilitiesResponse(AICapabilitiesRequest):
     ai_id: str
 
 
-class AIContextUpdate(BaseModel):
+class AIContextUpdate(UCLSchema):
     """Schema for AI context update"""
     ai_type: AIType
     ai_instance_id: str
     session_id: str
     domain_type: DomainType
-    updates: List[Dict[str, Any]]
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    # Items are read with .get() by the orchestrator, so each one is checked
+    updates: List[JSONObj]
+    metadata: JSONObj = Field(default_factory=dict)
 
 
-class AISubscriptionRequest(BaseModel):
+class AISubscriptionRequest(UCLSchema):
     """Schema for AI subscription request"""
     ai_instance_id: str
     domains: List[DomainType]
 
 
-class AISubscriptionResponse(BaseModel):
+class AISubscriptionResponse(UCLSchema):
     """Schema for AI subscription response"""
     subscription_id: str
     ai_instance_id: str
@@ -239,111 +260,111 @@ class AISubscriptionResponse(BaseModel):
 
 # Global Context Schemas
 
-class GlobalContextCreate(BaseModel):
+class GlobalContextCreate(UCLSchema):
     """Schema for creating global context"""
     project_id: str
-    shared_knowledge: Dict[str, Any] = Field(default_factory=dict)
-    shared_conventions: Dict[str, Any] = Field(default_factory=dict)
-    shared_resources: List[Dict[str, Any]] = Field(default_factory=list)
+    shared_knowledge: JSONObj = Field(default_factory=dict)
+    shared_conventions: JSONObj = Field(default_factory=dict)
+    shared_resources: JSONObjList = Field(default_factory=list)
     common_patterns: List[str] = Field(default_factory=list)
 
 
-class GlobalContextUpdate(BaseModel):
+class GlobalContextUpdate(UCLSchema):
     """Schema for updating global context"""
-    shared_knowledge: Optional[Dict[str, Any]] = None
-    shared_conventions: Optional[Dict[str, Any]] = None
-    shared_resources: Optional[List[Dict[str, Any]]] = None
+    shared_knowledge: Optional[JSONObj] = None
+    shared_conventions: Optional[JSONObj] = None
+    shared_resources: Optional[JSONObjList] = None
     common_patterns: Optional[List[str]] = None
-    cross_platform_insights: Optional[Dict[str, Any]] = None
+    cross_platform_insights: Optional[JSONObj] = None
 
 
-class GlobalContextResponse(BaseModel):
+class GlobalContextResponse(UCLSchema):
     """Schema for global context response"""
     id: str
     project_id: str
-    shared_knowledge: Dict[str, Any]
-    shared_conventions: Dict[str, Any]
-    shared_resources: List[Dict[str, Any]]
+    shared_knowledge: JSONObj
+    shared_conventions: JSONObj
+    shared_resources: JSONObjList
     common_patterns: List[str]
-    cross_platform_insights: Dict[str, Any]
+    cross_platform_insights: JSONObj
     last_updated: datetime
     version: int
 
 
 # Platform Context Schemas
 
-class PlatformContextCreate(BaseModel):
+class PlatformContextCreate(UCLSchema):
     """Schema for creating platform context"""
     platform_type: AIType
-    platform_specific_data: Dict[str, Any] = Field(default_factory=dict)
-    learned_preferences: Dict[str, Any] = Field(default_factory=dict)
+    platform_specific_data: JSONObj = Field(default_factory=dict)
+    learned_preferences: JSONObj = Field(default_factory=dict)
     custom_prompts: List[str] = Field(default_factory=list)
-    platform_conventions: Dict[str, Any] = Field(default_factory=dict)
+    platform_conventions: JSONObj = Field(default_factory=dict)
 
 
-class PlatformContextUpdate(BaseModel):
+class PlatformContextUpdate(UCLSchema):
     """Schema for updating platform context"""
-    platform_specific_data: Optional[Dict[str, Any]] = None
-    learned_preferences: Optional[Dict[str, Any]] = None
+    platform_specific_data: Optional[JSONObj] = None
+    learned_preferences: Optional[JSONObj] = None
     custom_prompts: Optional[List[str]] = None
-    platform_conventions: Optional[Dict[str, Any]] = None
-    performance_metrics: Optional[Dict[str, Any]] = None
+    platform_conventions: Optional[JSONObj] = None
+    performance_metrics: Optional[JSONObj] = None
 
 
-class PlatformContextResponse(BaseModel):
+class PlatformContextResponse(UCLSchema):
     """Schema for platform context response"""
     id: str
     platform_type: str
     project_id: str
     global_context_id: str
-    platform_specific_data: Dict[str, Any]
-    learned_preferences: Dict[str, Any]
-    interaction_history: List[Dict[str, Any]]
+    platform_specific_data: JSONObj
+    learned_preferences: JSONObj
+    interaction_history: JSONObjList
     custom_prompts: List[str]
-    platform_conventions: Dict[str, Any]
-    performance_metrics: Dict[str, Any]
+    platform_conventions: JSONObj
+    performance_metrics: JSONObj
     last_updated: datetime
     version: int
 
 
-class InteractionCreate(BaseModel):
+class InteractionCreate(UCLSchema):
     """Schema for creating interaction"""
     interaction_type: str = Field(..., description="Type of interaction (query, response, action)")
-    content: Dict[str, Any]
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    content: JSONObj
+    metadata: JSONObj = Field(default_factory=dict)
 
 
-class ContextQueryWithHierarchy(BaseModel):
+class ContextQueryWithHierarchy(UCLSchema):
     """Schema for hierarchical context query"""
-    query_text: str = Field(..., min_length=1)
+    query_text: NonEmptyStr
     platform_type: AIType
     include_global: bool = True
     include_platform: bool = True
     include_domains: bool = True
     domains_filter: Optional[List[DomainType]] = None
-    response_format: ResponseFormat = ResponseFormat.STRUCTURED
-    max_results: int = Field(default=100, ge=1, le=1000)
+    response_format: ResponseFormat = "structured"
+    max_results: MaxResults = 100
 
 
-class MergeInsightsRequest(BaseModel):
+class MergeInsightsRequest(UCLSchema):
     """Schema for merging insights to global context"""
-    insights: Dict[str, Any]
+    insights: JSONObj
     source_platform: AIType
     confidence_score: float = Field(default=1.0, ge=0.0, le=1.0)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: JSONObj = Field(default_factory=dict)
 
 
 # Analytics Schemas
 
-class ProjectAnalyticsResponse(BaseModel):
+class ProjectAnalyticsResponse(UCLSchema):
     """Schema for project analytics response"""
-    queries: Dict[str, Any]
-    sessions: Dict[str, Any]
-    domains: Dict[str, Any]
-    vector_store: Dict[str, Any]
+    queries: JSONObj
+    sessions: JSONObj
+    domains: JSONObj
+    vector_store: JSONObj
 
 
-class AIAnalyticsResponse(BaseModel):
+class AIAnalyticsResponse(UCLSchema):
     """Schema for AI analytics response"""
     period_days: int
     total_sessions: int
@@ -356,38 +377,38 @@ class AIAnalyticsResponse(BaseModel):
     active_subscriptions: int
 
 
-class CollaborationInsightsResponse(BaseModel):
+class CollaborationInsightsResponse(UCLSchema):
     """Schema for collaboration insights response"""
-    concurrent_usage: Dict[str, Any]
-    domain_overlap: Dict[str, Any]
-    handoff_patterns: Dict[str, Any]
+    concurrent_usage: JSONObj
+    domain_overlap: JSONObj
+    handoff_patterns: JSONObj
     collaboration_score: float
 
 
 # Error Schemas
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(UCLSchema):
     """Schema for error responses"""
     detail: str
     error_type: Optional[str] = None
     error_code: Optional[str] = None
 
 
-class ValidationErrorResponse(BaseModel):
+class ValidationErrorResponse(UCLSchema):
     """Schema for validation error responses"""
     detail: str
-    errors: List[Dict[str, Any]]
+    errors: JSONObjList
 
 
 # Common Response Schemas
 
-class SuccessResponse(BaseModel):
+class SuccessResponse(UCLSchema):
     """Schema for success responses"""
     success: bool = True
     message: Optional[str] = None
 
 
-class PaginatedResponse(BaseModel):
+class PaginatedResponse(UCLSchema):
     """Schema for paginated responses"""
     items: List[Any]
     total: int
@@ -1,17 +1,32 @@
 """Smart Synchronizing Client for UCL"""
 import asyncio
-import json
+import orjson
 import hashlib
+import heapq
+import random
+import re
+import time
+import httpx
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable
+from typing import Awaitable, Dict, Any, Optional, List, Callable, Set, Tuple
 import websockets
 import logging
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
+from functools import partial
 
 logger = logging.getLogger(__name__)
 
+# Words of a query, with surrounding punctuation ("how?", "error:") left out
+_WORD_RE = re.compile(r"\w+")
 
-@dataclass
+
+def _relevance(result: Dict[str, Any]) -> float:
+    """Sort key for search results"""
+    return result.get("relevance_score", 0)
+
+
+@dataclass(slots=True)
 class SyncState:
     """Tracks synchronization state"""
     last_sync: datetime = field(default_factory=datetime.utcnow)
@@ -28,6 +43,20 @@ class SmartSyncClient:
     synchronized with the latest context
     """
 
+    # Query types in priority order, matched against the whole words of a query
+    _QUERY_CATEGORIES: Tuple[Tuple[str, frozenset], ...] = (
+        ("implementation", frozenset({
+            "implement", "implementation", "implementing", "create", "creating", "build", "building",
+        })),
+        ("debugging", frozenset({
+            "debug", "debugging", "fix", "fixing", "error", "errors",
+        })),
+        ("explanation", frozenset({"explain", "explanation", "how", "what"})),
+        ("optimization", frozenset({
+            "optimize", "optimization", "optimizing", "improve", "improving", "performance",
+        })),
+    )
+
     def __init__(
         self,
         base_url: str = "http://localhost:8002/api/v1/ucl",
@@ -44,8 +73,25 @@ class SmartSyncClient:
 
         # Sync state
         self.sync_state = SyncState()
-        self.local_cache: Dict[str, Any] = {}
-        self.cache_timestamps: Dict[str, datetime] = {}
+        # cache_key -> (value, fresh until, stale until), monotonic times, least recently used first
+        self.local_cache: OrderedDict[str, Tuple[Any, float, float]] = OrderedDict()
+        # scope ("global", "platform", "domain") -> cache keys stored under it
+        self._cache_scopes: Dict[str, Set[str]] = defaultdict(set)
+        # Fetches in progress with the cache generation they started in, shared by
+        # every caller missing the same key while that generation is current
+        self._inflight: Dict[str, Tuple[asyncio.Task, Tuple[int, int, int]]] = {}
+        # Invalidation counters: whole cache, per scope and per key. A fetch only
+        # stores its result if none of them moved while it was running.
+        self._cache_epoch = 0
+        self._scope_generations: Dict[str, int] = defaultdict(int)
+        self._key_generations: Dict[str, int] = defaultdict(int)
+        # Domain types of the project, cached until the monotonic expiry
+        self._available_domains: Optional[List[str]] = None
+        self._available_domains_expiry = 0.0
+        # Debounced refetches scheduled by WebSocket invalidations, one per key
+        self._pending_refetch: Dict[str, asyncio.TimerHandle] = {}
+        # One pooled HTTP/2 client for every API call, closed in stop()
+        self._http = self._create_http_client()
 
         # Event handlers
         self.on_global_context_updated: Optional[Callable] = None
@@ -63,6 +109,13 @@ class SmartSyncClient:
         # Configuration
         self.sync_interval = 30  # seconds
         self.cache_ttl = 300  # 5 minutes
+        self.stale_ttl = 600  # serve expired entries this much longer while refreshing
+        self.cache_max_entries = 1024  # least recently used entries are evicted past this
+        self.submission_threshold = 16  # pending updates that trigger an early flush
+        self.refetch_delay = 0.05  # invalidations closer together than this share one refetch
+        self.reconnect_backoff = 0.5  # first WebSocket reconnect delay, doubled per failure
+        self.reconnect_backoff_max = 30  # seconds
+        self.offload_response_chars = 64 * 1024  # longer responses are analysed in a worker thread
         self.auto_contribute_insights = True
         self.offline_mode = False
 
@@ -72,6 +125,8 @@ class SmartSyncClient:
             return
 
         self._is_running = True
+        if self._http.is_closed:
+            self._http = self._create_http_client()
 
         # Start background tasks
         self._sync_task = asyncio.create_task(self._sync_loop())
@@ -80,7 +135,7 @@ class SmartSyncClient:
         # Initial sync
         await self._perform_full_sync()
 
-        logger.info(f"Smart sync client started for {self.platform_type}")
+        logger.info("Smart sync client started for %s", self.platform_type)
 
     async def stop(self):
         """Stop the smart sync client"""
@@ -95,10 +150,16 @@ class SmartSyncClient:
                 except asyncio.CancelledError:
                     pass
 
+        for handle in self._pending_refetch.values():
+            handle.cancel()
+        self._pending_refetch.clear()
+
         # Close websocket
         if self._websocket:
             await self._websocket.close()
 
+        await self._http.aclose()
+
         logger.info("Smart sync client stopped")
 
     # Context Access Methods (with automatic sync)
@@ -109,14 +170,19 @@ class SmartSyncClient:
         include_global: bool = True,
         include_platform: bool = True,
         include_domains: bool = True,
-        domains_filter: Optional[List[str]] = None
+        domains_filter: Optional[List[str]] = None,
+        top_k: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Get context for a query with automatic freshness checking"""
+        """Get context for a query with automatic freshness checking, keeping the top_k most relevant results"""
 
         # Check if we need to sync first
         if await self._needs_sync():
             await self._perform_incremental_sync()
 
+        # Lowercase and tokenize the query once for every context searched
+        query_lower = query.lower()
+        query_words = frozenset(query_lower.split())
+
         # Build context from cache
         context = {
             "query": query,
@@ -127,20 +193,25 @@ class SmartSyncClient:
         if include_global:
             global_context = await self._get_cached_global_context()
             if global_context:
-                context["results"].extend(self._search_in_context(global_context, query, "global"))
+                context["results"].extend(self._search_in_context(global_context, query_lower, query_words, "global"))
 
         if include_platform:
             platform_context = await self._get_cached_platform_context()
             if platform_context:
-                context["results"].extend(self._search_in_context(platform_context, query, "platform"))
+                context["results"].extend(self._search_in_context(platform_context, query_lower, query_words, "platform"))
 
         if include_domains:
             domain_contexts = await self._get_cached_domain_contexts(domains_filter)
             for domain_type, domain_context in domain_contexts.items():
-                context["results"].extend(self._search_in_context(domain_context, query, f"domain:{domain_type}"))
+                context["results"].extend(self._search_in_context(
+                    domain_context, query_lower, query_words, f"domain:{domain_type}"
+                ))
 
-        # Sort by relevance
-        context["results"].sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+        # Sort by relevance; a bounded heap selects the top results without sorting them all
+        if top_k is None:
+            context["results"].sort(key=_relevance, reverse=True)
+        else:
+            context["results"] = heapq.nlargest(top_k, context["results"], key=_relevance)
 
         return context
 
@@ -154,10 +225,17 @@ class SmartSyncClient:
         if contribute_insights is None:
             contribute_insights = self.auto_contribute_insights
 
-        success = await self._update_platform_context({
+        update = {
             "learned_preferences": preferences,
-            "last_updated": datetime.utcnow().isoformat()
-        })
+            "last_updated": datetime.utcnow()  # formatted by orjson when sent
+        }
+
+        # Offline changes are buffered and submitted by the sync loop once back online
+        if self.offline_mode or not self.sync_state.is_online:
+            await self._queue_update(update)
+            return True
+
+        success = await self._update_platform_context(update)
 
         if success and contribute_insights:
             # Extract and contribute valuable insights
@@ -179,7 +257,7 @@ class SmartSyncClient:
             "type": "successful_interaction",
             "query": query,
             "response_length": len(response),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),  # formatted by orjson when sent
             "platform": self.platform_type,
             "user_feedback": user_feedback or {}
         }
@@ -199,29 +277,21 @@ class SmartSyncClient:
         """Get global context from cache or fetch if stale"""
         cache_key = f"global:{self.project_id}"
 
-        if self._is_cache_fresh(cache_key):
-            return self.local_cache.get(cache_key)
-
-        # Fetch fresh data
-        global_context = await self._fetch_global_context()
-        if global_context:
-            self._update_cache(cache_key, global_context)
+        cached = self._cache_get(cache_key, self._fetch_global_context)
+        if cached is not None:
+            return cached
 
-        return global_context
+        return await self._fetch_once(cache_key, self._fetch_global_context)
 
     async def _get_cached_platform_context(self) -> Optional[Dict[str, Any]]:
         """Get platform context from cache or fetch if stale"""
         cache_key = f"platform:{self.project_id}:{self.platform_type}"
 
-        if self._is_cache_fresh(cache_key):
-            return self.local_cache.get(cache_key)
+        cached = self._cache_get(cache_key, self._fetch_platform_context)
+        if cached is not None:
+            return cached
 
-        # Fetch fresh data
-        platform_context = await self._fetch_platform_context()
-        if platform_context:
-            self._update_cache(cache_key, platform_context)
-
-        return platform_context
+        return await self._fetch_once(cache_key, self._fetch_platform_context)
 
     async def _get_cached_domain_contexts(
         self,
@@ -234,45 +304,181 @@ class SmartSyncClient:
         if not domains_filter:
             domains_filter = await self._get_available_domains()
 
+        missing = []
         for domain in domains_filter:
             cache_key = f"domain:{self.project_id}:{domain}"
+            fetch = partial(self._fetch_domain_context, domain)
 
-            if self._is_cache_fresh(cache_key):
-                cached = self.local_cache.get(cache_key)
-                if cached:
-                    contexts[domain] = cached
+            cached = self._cache_get(cache_key, fetch)
+            if cached is not None:
+                contexts[domain] = cached
             else:
-                # Fetch fresh data
-                domain_context = await self._fetch_domain_context(domain)
-                if domain_context:
-                    self._update_cache(cache_key, domain_context)
-                    contexts[domain] = domain_context
+                missing.append((domain, cache_key, fetch))
+
+        # Fetch all missing domains concurrently
+        fetched = await asyncio.gather(
+            *(self._fetch_once(cache_key, fetch) for _, cache_key, fetch in missing),
+            return_exceptions=True
+        )
+        for (domain, _, _), domain_context in zip(missing, fetched):
+            if isinstance(domain_context, Exception):
+                logger.error("Error fetching domain context %s: %s", domain, domain_context)
+            elif domain_context:
+                contexts[domain] = domain_context
 
         return contexts
 
-    def _is_cache_fresh(self, cache_key: str) -> bool:
-        """Check if cache entry is still fresh"""
-        if cache_key not in self.cache_timestamps:
-            return False
+    async def _get_available_domains(self) -> List[str]:
+        """Domain types of the project, refreshed once the cache TTL expires"""
+        if self._available_domains is not None and time.monotonic() < self._available_domains_expiry:
+            return self._available_domains
 
-        age = datetime.utcnow() - self.cache_timestamps[cache_key]
-        return age.total_seconds() < self.cache_ttl
+        domains = await self._fetch_available_domains()
+        if domains is None:
+            return self._available_domains or []
+
+        self._available_domains = domains
+        self._available_domains_expiry = time.monotonic() + self.cache_ttl
+        return domains
+
+    async def _fetch_once(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and cache a context, joining a fetch already in flight for the key"""
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(self._inflight_fetch(cache_key, fetch))
+
+    def _inflight_fetch(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> asyncio.Task:
+        """Get the in-flight fetch task for a key, starting one if needed"""
+        generation = self._cache_generation(cache_key)
+        inflight = self._inflight.get(cache_key)
+        # A fetch started before the last invalidation may return pre-update data
+        if inflight is not None and inflight[1] == generation:
+            return inflight[0]
+
+        task = asyncio.create_task(self._fetch_into_cache(cache_key, fetch, generation))
+        self._inflight[cache_key] = (task, generation)
+        task.add_done_callback(partial(self._inflight_done, cache_key))
+        return task
+
+    def _inflight_done(self, cache_key: str, task: asyncio.Task):
+        """Forget a finished fetch, unless a newer one already replaced it"""
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None and inflight[0] is task:
+            del self._inflight[cache_key]
+
+    async def _fetch_into_cache(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        generation: Tuple[int, int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch fresh data and store it, unless the key was invalidated meanwhile"""
+        data = await fetch()
+        if data and self._cache_generation(cache_key) == generation:
+            self._update_cache(cache_key, data)
+        return data
+
+    def _cache_generation(self, cache_key: str) -> Tuple[int, int, int]:
+        """Invalidation counters covering a key"""
+        return (
+            self._cache_epoch,
+            self._scope_generations.get(cache_key.partition(":")[0], 0),
+            self._key_generations.get(cache_key, 0),
+        )
+
+    def _cache_get(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, serving it stale while a background fetch refreshes it"""
+        entry = self.local_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        self.local_cache.move_to_end(cache_key)
+        value, fresh_until, stale_until = entry
+        now = time.monotonic()
+        if now < fresh_until:
+            return value
+        if now < stale_until:
+            if cache_key not in self._inflight:
+                self._inflight_fetch(cache_key, fetch).add_done_callback(self._log_refresh_error)
+            return value
+        return None
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task):
+        """Log a failed background refresh, which no caller awaits"""
+        if not task.cancelled() and task.exception():
+            logger.error("Error refreshing cached context: %s", task.exception())
 
     def _update_cache(self, cache_key: str, data: Dict[str, Any]):
         """Update cache entry"""
-        self.local_cache[cache_key] = data
-        self.cache_timestamps[cache_key] = datetime.utcnow()
-
-    def _invalidate_cache(self, pattern: str = None):
-        """Invalidate cache entries"""
-        if pattern:
-            keys_to_remove = [k for k in self.local_cache.keys() if pattern in k]
-            for key in keys_to_remove:
-                self.local_cache.pop(key, None)
-                self.cache_timestamps.pop(key, None)
-        else:
+        now = time.monotonic()
+        self.local_cache[cache_key] = (data, now + self.cache_ttl, now + self.cache_ttl + self.stale_ttl)
+        self.local_cache.move_to_end(cache_key)
+        self._cache_scopes[cache_key.partition(":")[0]].add(cache_key)
+
+        while len(self.local_cache) > self.cache_max_entries:
+            evicted, _ = self.local_cache.popitem(last=False)
+            self._cache_scopes[evicted.partition(":")[0]].discard(evicted)
+
+    def _cleanup_expired(self):
+        """Drop cache entries that are past even their stale window"""
+        now = time.monotonic()
+        expired = [key for key, (_, _, stale_until) in self.local_cache.items() if stale_until <= now]
+        # Expiry is not an invalidation: a refresh already running may still store its result
+        for key in expired:
+            self.local_cache.pop(key, None)
+            self._cache_scopes[key.partition(":")[0]].discard(key)
+
+    def _invalidate_cache(self, scope: Optional[str] = None):
+        """Invalidate a single cache key, every key of a scope, or the whole cache"""
+        if scope is None:
+            self._cache_epoch += 1
             self.local_cache.clear()
-            self.cache_timestamps.clear()
+            self._cache_scopes.clear()
+        elif ":" in scope:
+            self._key_generations[scope] += 1
+            self.local_cache.pop(scope, None)
+            self._cache_scopes[scope.partition(":")[0]].discard(scope)
+        else:
+            self._scope_generations[scope] += 1
+            for key in self._cache_scopes.pop(scope, ()):
+                self.local_cache.pop(key, None)
+
+    def _schedule_refetch(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ):
+        """Invalidate and refetch a key once invalidations for it stop arriving"""
+        handle = self._pending_refetch.get(cache_key)
+        if handle:
+            handle.cancel()
+        self._pending_refetch[cache_key] = asyncio.get_running_loop().call_later(
+            self.refetch_delay, self._run_refetch, cache_key, fetch
+        )
+
+    def _run_refetch(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ):
+        """Drop a cached key and start its refetch in the background"""
+        self._pending_refetch.pop(cache_key, None)
+        # Bumps the key's generation, so this starts a new fetch instead of
+        # joining one that began before the update
+        self._invalidate_cache(cache_key)
+        self._inflight_fetch(cache_key, fetch).add_done_callback(self._log_refresh_error)
 
     # Synchronization Logic
 
@@ -288,29 +494,42 @@ class SmartSyncClient:
                     if self.sync_state.pending_updates:
                         await self._process_pending_updates()
 
+                self._cleanup_expired()
+
                 await asyncio.sleep(self.sync_interval)
 
             except Exception as e:
-                logger.error(f"Error in sync loop: {e}")
+                logger.error("Error in sync loop: %s", e)
                 await asyncio.sleep(10)
 
     async def _websocket_loop(self):
         """WebSocket connection for real-time updates"""
+        backoff = self.reconnect_backoff
         while self._is_running:
             try:
                 if not self.offline_mode:
                     url = f"{self.websocket_url}/projects/{self.project_id}/stream"
-                    async with websockets.connect(url) as websocket:
+                    # Frames are small JSON documents: per-message deflate costs more CPU than it saves
+                    async with websockets.connect(url, compression=None, max_size=2**22) as websocket:
                         self._websocket = websocket
                         self.sync_state.is_online = True
 
                         async for message in websocket:
-                            await self._handle_websocket_message(json.loads(message))
+                            # Only a connection that delivers messages counts as recovered
+                            backoff = self.reconnect_backoff
+                            await self._handle_websocket_message(orjson.loads(message))
+
+                    logger.info("WebSocket closed by server, reconnecting")
+                    self.sync_state.is_online = False
 
             except Exception as e:
-                logger.error(f"WebSocket error: {e}")
+                logger.error("WebSocket error: %s", e)
                 self.sync_state.is_online = False
-                await asyncio.sleep(5)
+
+            # Exponential backoff with jitter so clients do not reconnect in lockstep,
+            # also after a clean close so an accept-then-close server is not hammered
+            await asyncio.sleep(min(backoff + random.uniform(0, backoff), self.reconnect_backoff_max))
+            backoff = min(backoff * 2, self.reconnect_backoff_max)
 
     async def _handle_websocket_message(self, message: Dict[str, Any]):
         """Handle real-time updates from WebSocket"""
@@ -327,17 +546,14 @@ class SmartSyncClient:
 
     async def _handle_global_context_update(self, message: Dict[str, Any]):
         """Handle global context update"""
-        # Invalidate global context cache
-        self._invalidate_cache("global:")
-
-        # Fetch fresh global context
-        await self._get_cached_global_context()
+        # Refetch global context once the burst of updates settles
+        self._schedule_refetch(f"global:{self.project_id}", self._fetch_global_context)
 
         # Notify handler
         if self.on_global_context_updated:
             await self.on_global_context_updated(message["changes"])
 
-        logger.debug("Global context updated and cache refreshed")
+        logger.debug("Global context updated, refresh scheduled")
 
     async def _handle_platform_context_update(self, message: Dict[str, Any]):
         """Handle platform context update"""
@@ -361,14 +577,20 @@ class SmartSyncClient:
         """Handle domain context update"""
         domain_type = message.get("domain_type")
 
-        # Invalidate domain cache
-        self._invalidate_cache(f"domain:{self.project_id}:{domain_type}")
+        # A domain we have not seen means the domain list is out of date
+        if self._available_domains is not None and domain_type not in self._available_domains:
+            self._available_domains_expiry = 0.0
+
+        # Refetch the domain if it is cached, once the burst of updates settles
+        cache_key = f"domain:{self.project_id}:{domain_type}"
+        if cache_key in self.local_cache or cache_key in self._pending_refetch:
+            self._schedule_refetch(cache_key, partial(self._fetch_domain_context, domain_type))
 
         # Notify handler
         if self.on_domain_context_updated:
             await self.on_domain_context_updated(message["changes"], domain_type)
 
-        logger.debug(f"Domain context updated: {domain_type}")
+        logger.debug("Domain context updated: %s", domain_type)
 
     async def _handle_new_insights(self, message: Dict[str, Any]):
         """Handle new insights from other platforms"""
@@ -385,7 +607,7 @@ class SmartSyncClient:
             if self.on_insights_received:
                 await self.on_insights_received(applicable_insights, source_platform)
 
-        logger.debug(f"Received insights from {source_platform}")
+        logger.debug("Received insights from %s", source_platform)
 
     async def _needs_sync(self) -> bool:
         """Check if synchronization is needed"""
@@ -404,6 +626,24 @@ class SmartSyncClient:
 
         return False
 
+    async def _queue_update(self, update: Dict[str, Any]):
+        """Queue an update for the next batch, flushing early once the buffer is full"""
+        self.sync_state.pending_updates.append(update)
+        if len(self.sync_state.pending_updates) >= self.submission_threshold and not self.offline_mode:
+            await self._process_pending_updates()
+
+    async def _process_pending_updates(self):
+        """Submit every pending update in a single batch"""
+        updates = self.sync_state.pending_updates
+        if not updates:
+            return
+
+        self.sync_state.pending_updates = []
+        if not await self._submit_updates(updates):
+            # Retry on the next pass, ahead of anything queued meanwhile
+            self.sync_state.pending_updates[:0] = updates
+            logger.warning("Could not submit %s pending updates, will retry", len(updates))
+
     async def _perform_full_sync(self):
         """Perform complete synchronization"""
         logger.info("Performing full synchronization")
@@ -412,10 +652,12 @@ class SmartSyncClient:
             # Clear cache
             self._invalidate_cache()
 
-            # Fetch all contexts
-            await self._get_cached_global_context()
-            await self._get_cached_platform_context()
-            await self._get_cached_domain_contexts()
+            # Fetch all contexts concurrently; the cache was just emptied, so skip the lookups
+            await asyncio.gather(
+                self._fetch_once(f"global:{self.project_id}", self._fetch_global_context),
+                self._fetch_once(f"platform:{self.project_id}:{self.platform_type}", self._fetch_platform_context),
+                self._get_cached_domain_contexts()
+            )
 
             # Update sync state
             self.sync_state.last_sync = datetime.utcnow()
@@ -427,7 +669,7 @@ class SmartSyncClient:
             logger.info("Full synchronization completed")
 
         except Exception as e:
-            logger.error(f"Error during full sync: {e}")
+            logger.error("Error during full sync: %s", e)
 
     async def _perform_incremental_sync(self):
         """Perform incremental synchronization"""
@@ -445,19 +687,19 @@ class SmartSyncClient:
                 await self.on_sync_completed("incremental")
 
         except Exception as e:
-            logger.error(f"Error during incremental sync: {e}")
+            logger.error("Error during incremental sync: %s", e)
 
     # Helper Methods
 
     def _search_in_context(
         self,
         context: Dict[str, Any],
-        query: str,
+        query_lower: str,
+        query_words: frozenset,
         source_type: str
     ) -> List[Dict[str, Any]]:
-        """Search for query terms in context data"""
+        """Search for a lowercased query in context data"""
         results = []
-        query_lower = query.lower()
 
         # Simple text search - can be enhanced with better algorithms
         for key, value in context.items():
@@ -468,13 +710,13 @@ class SmartSyncClient:
                         "type": key,
                         "source_type": source_type,
                         "content": value,
-                        "relevance_score": self._calculate_relevance(query_lower, value_str),
+                        "relevance_score": self._calculate_relevance(query_lower, query_words, value_str),
                         "context_key": key
                     })
 
         return results
 
-    def _calculate_relevance(self, query: str, content: str) -> float:
+    def _calculate_relevance(self, query: str, query_words: frozenset, content: str) -> float:
         """Calculate relevance score for search results"""
         # Simple relevance calculation - can be enhanced
         if query == content:
@@ -484,9 +726,7 @@ class SmartSyncClient:
             return 0.8
 
         # Calculate word overlap
-        query_words = set(query.split())
-        content_words = set(content.split())
-        overlap = len(query_words.intersection(content_words))
+        overlap = len(query_words.intersection(content.split()))
 
         if overlap > 0:
             return 0.5 + (overlap / len(query_words)) * 0.3
@@ -522,9 +762,15 @@ class SmartSyncClient:
         if feedback.get("satisfaction", 0) < 4:  # Only from highly satisfied interactions
             return None
 
+        # Large responses are scanned off the event loop so WebSocket handling is not delayed
+        if len(response) >= self.offload_response_chars:
+            response_style = await asyncio.to_thread(self._analyze_response_style, response)
+        else:
+            response_style = self._analyze_response_style(response)
+
         patterns = {
             "query_type": self._classify_query_type(query),
-            "response_style": self._analyze_response_style(response),
+            "response_style": response_style,
             "success_factors": feedback.get("what_worked", [])
         }
 
@@ -532,57 +778,126 @@ class SmartSyncClient:
 
     def _classify_query_type(self, query: str) -> str:
         """Classify the type of query"""
-        query_lower = query.lower()
+        query_words = frozenset(_WORD_RE.findall(query.lower()))
 
-        if any(word in query_lower for word in ["implement", "create", "build"]):
-            return "implementation"
-        elif any(word in query_lower for word in ["debug", "fix", "error"]):
-            return "debugging"
-        elif any(word in query_lower for word in ["explain", "how", "what"]):
-            return "explanation"
-        elif any(word in query_lower for word in ["optimize", "improve", "performance"]):
-            return "optimization"
-        else:
-            return "general"
+        for query_type, keywords in self._QUERY_CATEGORIES:
+            if not keywords.isdisjoint(query_words):
+                return query_type
+        return "general"
 
     def _analyze_response_style(self, response: str) -> Dict[str, Any]:
         """Analyze response characteristics"""
+        response_lower = response.lower()
         return {
             "length": len(response),
             "has_code": "```" in response,
-            "has_examples": "example" in response.lower(),
-            "structure": "step_by_step" if any(word in response.lower() for word in ["step", "first", "then"]) else "direct"
+            "has_examples": "example" in response_lower,
+            "structure": "step_by_step" if any(word in response_lower for word in ["step", "first", "then"]) else "direct"
         }
 
     # API Communication Methods
 
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Build the keep-alive HTTP client used for all API calls"""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers=headers,
+        )
+
+    async def _get_json(self, path: str) -> Optional[Any]:
+        """GET a JSON document from the API, None when missing or unreachable"""
+        try:
+            response = await self._http.get(path)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("GET %s failed: %s", path, e)
+            return None
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # e.g. a proxy error page served with 200
+            logger.warning("GET %s returned invalid JSON: %s", path, e)
+            return None
+
+    async def _send_json(self, method: str, path: str, payload: Dict[str, Any]) -> bool:
+        """Send a JSON payload to the API, reporting whether it was accepted"""
+        try:
+            response = await self._http.request(method, path, content=orjson.dumps(payload, default=str))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("%s %s failed: %s", method, path, e)
+            return False
+        return True
+
     async def _fetch_global_context(self) -> Optional[Dict[str, Any]]:
         """Fetch global context from API"""
-        # Implementation would use httpx or similar
-        # This is a placeholder
-        return {}
+        return await self._get_json(f"/projects/{self.project_id}/global-context")
 
     async def _fetch_platform_context(self) -> Optional[Dict[str, Any]]:
         """Fetch platform context from API"""
-        # Implementation would use httpx or similar
-        return {}
+        return await self._get_json(f"/projects/{self.project_id}/platform-contexts/{self.platform_type}")
 
     async def _fetch_domain_context(self, domain_type: str) -> Optional[Dict[str, Any]]:
         """Fetch domain context from API"""
-        # Implementation would use httpx or similar
-        return {}
+        return await self._get_json(f"/projects/{self.project_id}/domains/{domain_type}")
+
+    async def _fetch_available_domains(self) -> Optional[List[str]]:
+        """Fetch the domain types defined for the project"""
+        domains = await self._get_json(f"/projects/{self.project_id}/domains")
+        if domains is None:
+            return None
+        return [domain["domain_type"] for domain in domains]
+
+    async def _platform_context_id(self) -> Optional[str]:
+        """Id of this platform's context, needed by the write endpoints"""
+        platform_context = await self._get_cached_platform_context()
+        return platform_context.get("id") if platform_context else None
 
     async def _update_platform_context(self, updates: Dict[str, Any]) -> bool:
         """Update platform context via API"""
-        # Implementation would use httpx or similar
-        return True
+        context_id = await self._platform_context_id()
+        if not context_id:
+            return False
+        return await self._send_json("PUT", f"/platform-contexts/{context_id}", updates)
+
+    async def _submit_updates(self, updates: List[Dict[str, Any]]) -> bool:
+        """Submit a batch of platform context updates in one API call"""
+        # Collapse the batch into one PUT the way the server applies them in turn:
+        # dict fields are merged key by key, list fields extended, the rest last-wins
+        merged: Dict[str, Any] = {}
+        for update in updates:
+            for key, value in update.items():
+                current = merged.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged[key] = {**current, **value}
+                elif isinstance(current, list) and isinstance(value, list):
+                    merged[key] = current + value
+                else:
+                    merged[key] = value
+        return await self._update_platform_context(merged)
 
     async def _contribute_insights(self, insights: Dict[str, Any]) -> bool:
         """Contribute insights to global context"""
-        # Implementation would use httpx or similar
-        return True
+        return await self._send_json(
+            "POST",
+            f"/projects/{self.project_id}/global-context/merge-insights",
+            {"insights": insights, "source_platform": self.platform_type},
+        )
 
     async def _add_to_platform_history(self, interaction: Dict[str, Any]):
         """Add interaction to platform history"""
-        # Implementation would use httpx or similar
-        pass
\ No newline at end of file
+        context_id = await self._platform_context_id()
+        if not context_id:
+            return
+        await self._send_json(
+            "POST",
+            f"/platform-contexts/{context_id}/interactions",
+            {"interaction_type": interaction.get("type", "interaction"), "content": interaction},
+        )
@@ -22,6 +22,14 @@ class UCLMCPServer:
 
     def __init__(self, config: UCLConfig):
         self.config = config
+        # One pooled client for every tool and resource call, closed in aclose()
+        self._client = httpx.AsyncClient(
+            base_url=self.config.ucl_api_base,
+            headers=self._get_headers(),
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+            timeout=httpx.Timeout(10.0),
+        )
         self.server = MCPServer("ucl-context-server")
         self._setup_tools()
         self._setup_resources()
@@ -43,25 +51,23 @@ class UCLMCPServer:
         ) -> Dict[str, Any]:
             """Query project context with all hierarchy levels"""
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.config.ucl_api_base}/projects/{self.config.project_id}/query-hierarchy",
-                    json={
-                        "query_text": query,
-                        "platform_type": self.config.platform_type,
-                        "include_global": include_global,
-                        "include_platform": include_platform,
-                        "include_domains": include_domains,
-                        "domains_filter": domains_filter,
-                        "max_results": max_results
-                    },
-                    headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"Failed to query context: {response.text}"}
+            response = await self._client.post(
+                f"/projects/{self.config.project_id}/query-hierarchy",
+                json={
+                    "query_text": query,
+                    "platform_type": self.config.platform_type,
+                    "include_global": include_global,
+                    "include_platform": include_platform,
+                    "include_domains": include_domains,
+                    "domains_filter": domains_filter,
+                    "max_results": max_results
+                }
+            )
+
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return {"error": f"Failed to query context: {response.text}"}
 
         @self.server.tool(
             name="get_global_context",
@@ -70,16 +76,14 @@ class UCLMCPServer:
         async def get_global_context() -> Dict[str, Any]:
             """Get global context shared across all AI platforms"""
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.config.ucl_api_base}/projects/{self.config.project_id}/global-context",
-                    headers=self._get_headers()
-                )
+            response = await self._client.get(
+                f"/projects/{self.config.project_id}/global-context"
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"Failed to get global context: {response.text}"}
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return {"error": f"Failed to get global context: {response.text}"}
 
         @self.server.tool(
             name="get_my_platform_context",
@@ -88,19 +92,17 @@ class UCLMCPServer:
         async def get_my_platform_context() -> Dict[str, Any]:
             """Get platform-specific context for this AI"""
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.config.ucl_api_base}/projects/{self.config.project_id}/platform-contexts/{self.config.platform_type}",
-                    headers=self._get_headers()
-                )
+            response = await self._client.get(
+                f"/projects/{self.config.project_id}/platform-contexts/{self.config.platform_type}"
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    # Create platform context if it doesn't exist
-                    return await self._create_platform_context()
-                else:
-                    return {"error": f"Failed to get platform context: {response.text}"}
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 404:
+                # Create platform context if it doesn't exist
+                return await self._create_platform_context()
+            else:
+                return {"error": f"Failed to get platform context: {response.text}"}
 
         @self.server.tool(
             name="update_my_preferences",
@@ -120,21 +122,19 @@ class UCLMCPServer:
 
             context_id = platform_context["id"]
 
-            async with httpx.AsyncClient() as client:
-                response = await client.put(
-                    f"{self.config.ucl_api_base}/platform-contexts/{context_id}",
-                    json={
-                        "learned_preferences": learned_preferences,
-                        "custom_prompts": custom_prompts,
-                        "platform_conventions": platform_conventions
-                    },
-                    headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    return {"success": True, "message": "Preferences updated successfully"}
-                else:
-                    return {"error": f"Failed to update preferences: {response.text}"}
+            response = await self._client.put(
+                f"/platform-contexts/{context_id}",
+                json={
+                    "learned_preferences": learned_preferences,
+                    "custom_prompts": custom_prompts,
+                    "platform_conventions": platform_conventions
+                }
+            )
+
+            if response.status_code == 200:
+                return {"success": True, "message": "Preferences updated successfully"}
+            else:
+                return {"error": f"Failed to update preferences: {response.text}"}
 
         @self.server.tool(
             name="log_interaction",
@@ -154,21 +154,19 @@ class UCLMCPServer:
 
             context_id = platform_context["id"]
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.config.ucl_api_base}/platform-contexts/{context_id}/interactions",
-                    json={
-                        "interaction_type": interaction_type,
-                        "content": content,
-                        "metadata": metadata or {}
-                    },
-                    headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    return {"success": True, "message": "Interaction logged successfully"}
-                else:
-                    return {"error": f"Failed to log interaction: {response.text}"}
+            response = await self._client.post(
+                f"/platform-contexts/{context_id}/interactions",
+                json={
+                    "interaction_type": interaction_type,
+                    "content": content,
+                    "metadata": metadata or {}
+                }
+            )
+
+            if response.status_code == 200:
+                return {"success": True, "message": "Interaction logged successfully"}
+            else:
+                return {"error": f"Failed to log interaction: {response.text}"}
 
         @self.server.tool(
             name="contribute_to_global_context",
@@ -181,22 +179,20 @@ class UCLMCPServer:
         ) -> Dict[str, Any]:
             """Contribute insights to shared global context"""
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.config.ucl_api_base}/projects/{self.config.project_id}/global-context/merge-insights",
-                    json={
-                        "insights": insights,
-                        "source_platform": self.config.platform_type,
-                        "confidence_score": confidence_score,
-                        "metadata": metadata or {}
-                    },
-                    headers=self._get_headers()
-                )
-
-                if response.status_code == 200:
-                    return {"success": True, "message": "Insights contributed successfully"}
-                else:
-                    return {"error": f"Failed to contribute insights: {response.text}"}
+            response = await self._client.post(
+                f"/projects/{self.config.project_id}/global-context/merge-insights",
+                json={
+                    "insights": insights,
+                    "source_platform": self.config.platform_type,
+                    "confidence_score": confidence_score,
+                    "metadata": metadata or {}
+                }
+            )
+
+            if response.status_code == 200:
+                return {"success": True, "message": "Insights contributed successfully"}
+            else:
+                return {"error": f"Failed to contribute insights: {response.text}"}
 
     def _setup_resources(self):
         """Setup MCP resources for static context data"""
@@ -267,35 +263,29 @@ class UCLMCPServer:
             "platform_conventions": {}
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config.ucl_api_base}/projects/{self.config.project_id}/platform-contexts",
-                json=default_context,
-                headers=self._get_headers()
-            )
+        response = await self._client.post(
+            f"/projects/{self.config.project_id}/platform-contexts",
+            json=default_context
+        )
 
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"error": f"Failed to create platform context: {response.text}"}
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return {"error": f"Failed to create platform context: {response.text}"}
 
     async def _get_global_context_direct(self) -> Dict[str, Any]:
         """Direct call to get global context"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.config.ucl_api_base}/projects/{self.config.project_id}/global-context",
-                headers=self._get_headers()
-            )
-            return response.json() if response.status_code == 200 else {"error": response.text}
+        response = await self._client.get(
+            f"/projects/{self.config.project_id}/global-context"
+        )
+        return response.json() if response.status_code == 200 else {"error": response.text}
 
     async def _get_platform_context_direct(self) -> Dict[str, Any]:
         """Direct call to get platform context"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.config.ucl_api_base}/projects/{self.config.project_id}/platform-contexts/{self.config.platform_type}",
-                headers=self._get_headers()
-            )
-            return response.json() if response.status_code == 200 else {"error": response.text}
+        response = await self._client.get(
+            f"/projects/{self.config.project_id}/platform-contexts/{self.config.platform_type}"
+        )
+        return response.json() if response.status_code == 200 else {"error": response.text}
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -306,7 +296,14 @@ class UCLMCPServer:
 
     async def run(self, host: str = "localhost", port: int = 8100):
         """Run the MCP server"""
-        await self.server.run(host=host, port=port)
+        try:
+            await self.server.run(host=host, port=port)
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._client.aclose()
 
 
 # Configuration and startup
@@ -184,7 +184,7 @@ async def stream_project_events(project_id: str):
                     }
 
         except asyncio.CancelledError:
-            logger.info(f"SSE connection cancelled for project {project_id}")
+            logger.info("SSE connection cancelled for project %s", project_id)
         finally:
             await event_manager.unsubscribe(queue)
 
@@ -224,7 +224,7 @@ async def stream_platform_events(platform_type: str):
                     }
 
         except asyncio.CancelledError:
-            logger.info(f"SSE connection cancelled for platform {platform_type}")
+            logger.info("SSE connection cancelled for platform %s", platform_type)
         finally:
             await event_manager.unsubscribe(queue)
 
@@ -1,10 +1,32 @@
 #!/bin/bash
 
+# Optional argument: $1
+# Usage:
+#   ./run_fastapi.sh           -> runs the default command
+#   ./run_fastapi.sh PRO       -> runs the PRO command
+
 # Run FastAPI with uvicorn
 echo "Starting FastAPI application with uvicorn..."
 
 # Set environment variables
 export DJANGO_SETTINGS_MODULE=config.settings.staticfiles
 
-# Run with uvicorn
-uvicorn config.asgi:application --host 0.0.0.0 --port 8002 --reload --log-level info
\ No newline at end of file
+if [ "$1" = "PRO" ]; then
+    echo "Running in PRO mode..."
+    # One uvicorn worker per core; UvicornWorker runs on uvloop and httptools,
+    # both pulled in by uvicorn[standard]. Each worker is async, so more
+    # workers than cores only adds processes competing for the same CPUs.
+    WORKERS=${WORKERS:-$(nproc)}
+    # Every worker owns its own psycopg pool: split PostgreSQL's
+    # max_connections (minus headroom for admin/migration sessions) between them
+    DB_MAX_CONNECTIONS=${DB_MAX_CONNECTIONS:-100}
+    POOL_SIZE=$(( (DB_MAX_CONNECTIONS - 10) / WORKERS ))
+    export DB_POOL_MAX_SIZE=${DB_POOL_MAX_SIZE:-$(( POOL_SIZE > 2 ? POOL_SIZE : 2 ))}
+    # The response and repository TTL caches are per process: a write served by
+    # one worker only invalidates that worker, the others can keep serving the
+    # old value until their entries expire (up to ~120 s with both layers)
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker -w $WORKERS -b :8002 --worker-connections=1000 --backlog=2048 --timeout=120 --log-level=info --access-logfile=- --error-logfile=- --log-file=-
+else
+    echo "Running in default (DEV) mode..."
+    uvicorn config.asgi:application --host 0.0.0.0 --port 8002 --loop uvloop --http httptools --reload --log-level info
+fi